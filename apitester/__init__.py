@@ -1,4 +1,15 @@
-# First Party
-from apitester.app import APITester, run
+# Standard Library
+from typing import Any
 
 __all__ = ["APITester", "run"]
+
+
+def __getattr__(name: str) -> Any:
+    # Textual is only imported when the TUI is actually wanted
+    if name in __all__:
+        # First Party
+        from apitester import app
+
+        return getattr(app, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
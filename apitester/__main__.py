@@ -1,5 +1,5 @@
 # First Party
-from apitester import run
+from apitester.cli import main
 
 if __name__ == "__main__":
-    run()
+    main()
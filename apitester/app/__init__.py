@@ -2,8 +2,8 @@
 from apitester.app.app import APITester
 
 
-def run():
-    APITester().run()
+def run(watch_config: bool | None = None):
+    APITester(watch_config=watch_config).run()
 
 
 __all__ = ["APITester", "run"]
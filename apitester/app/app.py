@@ -1,19 +1,44 @@
 # Standard Library
 # Third Party
+from textual import on
 from textual.app import App, ComposeResult
+from textual.message import Message
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.widgets import Button, Footer, Header, Tree
 
 # First Party
-from apitester.app.screens import AddURLScreen, APIKeyScreen, LoginScreen, PluginScreen, QuitScreen, BasicAuthScreen
-from apitester.config import config
+from apitester.app.screens import (
+    AddURLScreen,
+    APIKeyScreen,
+    BasicAuthScreen,
+    FanOutScreen,
+    HistoryScreen,
+    LoadTestScreen,
+    LoginScreen,
+    PluginScreen,
+    QuitScreen,
+    SearchScreen,
+)
+from apitester.auth import auth
+from apitester.config import config, ConfigDiff
+from apitester.history import HistoryStore
 from apitester.plugin_manager import PluginManager
+from apitester.profiling import profile
+from apitester.search import SearchIndex
+from apitester.session import SessionManager
+from apitester.watcher import FileWatcher
 from apitester.widgets import Endpoint, URLTree
 
 
 class APITester(App):
     """Small, Simple API Tester."""
 
+    class ConfigChanged(Message):
+        def __init__(self, diff: ConfigDiff | None = None, error: str | None = None) -> None:
+            self.diff = diff
+            self.error = error
+            super().__init__()
+
     CSS_PATH = "../styles/main.css"
 
     BINDINGS = [
@@ -22,9 +47,24 @@ class APITester(App):
         ("r", "reload_config", "Reload Config"),
         ("n", "add_url", "Add a new url"),
         ("p", "plugin_list", "Show plugin list"),
+        ("l", "load_test", "Load test"),
+        ("h", "history", "History"),
+        ("f", "fan_out", "Fan out"),
+        ("s", "search", "Search"),
     ]
 
     plugin_manager: PluginManager
+    session_manager: SessionManager
+    history_store: HistoryStore
+
+    def __init__(self, *args, watch_config: bool | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.session_manager = SessionManager(config.session)
+        self.history_store = HistoryStore(config.history)
+        self.watcher: FileWatcher | None = None
+        self.search_index: SearchIndex | None = None
+        if config.watch.enabled if watch_config is None else watch_config:
+            self.watcher = FileWatcher(config.path, self._config_changed, config.watch.debounce, config.watch.poll_interval)
 
     def compose(self) -> ComposeResult:
         tree: URLTree = URLTree(config.urls, id="urltree")
@@ -46,18 +86,83 @@ class APITester(App):
         yield Footer()
 
     def on_mount(self):
-        self.plugin_manager = PluginManager(self.log)
+        self.plugin_manager = PluginManager.instance(self.log)
+        self.call_after_refresh(self._first_paint)
+        if self.watcher is not None:
+            self.watcher.start()
+
+    def _first_paint(self) -> None:
+        profile.mark("first paint")
+        # Background work waits until something is on screen, so its imports don't hold up the first paint
+        self.run_worker(auth.prefetch, thread=True, exit_on_error=False)
+        self.run_worker(self._build_search_index, thread=True)
+
+    async def on_unmount(self) -> None:
+        if self.watcher is not None:
+            self.watcher.stop()
+        await self.session_manager.close()
+        self.history_store.close()
 
     def action_reload_config(self) -> None:
-        if config.check_reload():
-            self._reload()
-            self.notify("Reloaded OK", title="Reload Config")
+        diff = config.check_reload()
+        diff.settings |= config.refresh_settings()
+        if diff:
+            self._reloaded(diff)
         else:
             self.notify("No changes", title="Reload Config")
 
+    def _config_changed(self) -> None:
+        """Called on the watcher's thread, so parsing and validation stay off the event loop.
+
+        The result is posted rather than handed over with call_from_thread, which would block the watcher
+        on the event loop, and so deadlock with on_unmount stopping the watcher while a reload is running.
+        """
+        try:
+            diff = config.check_reload()
+        except (OSError, ValueError) as e:
+            self.post_message(self.ConfigChanged(error=str(e)))
+            return
+
+        if diff:
+            self.post_message(self.ConfigChanged(diff))
+
+    @on(ConfigChanged)
+    def _config_changed_on_disk(self, message: ConfigChanged) -> None:
+        if message.error is not None:
+            self.notify(message.error, title="Reload Config", severity="error", timeout=10)
+        elif message.diff is not None:
+            self._reloaded(message.diff)
+
+    def _reloaded(self, diff: ConfigDiff) -> None:
+        self.session_manager.reconfigure()
+        self._reload()
+        if config.openapi:
+            self.run_worker(self._load_openapi, thread=True, group="openapi")
+        counts = f"{len(diff.added)} added, {len(diff.changed)} changed, {len(diff.removed)} removed"
+        self.notify(f"Reloaded OK, {counts}", title="Reload Config")
+
     def _reload(self) -> None:
         if tree := self.query_one(URLTree):
-            tree.update(config.urls)
+            diff = tree.update(config.urls)
+            if self.search_index is not None:
+                self.search_index.update(diff)
+
+    def _load_openapi(self) -> None:
+        try:
+            diff = config.load_openapi()
+        except (OSError, ValueError) as e:
+            self.call_from_thread(self.notify, str(e), title="OpenAPI", severity="error", timeout=10)
+            return
+
+        if diff:
+            self.call_from_thread(self._reload)
+            self.call_from_thread(self.notify, f"{len(diff.added)} endpoints imported", title="OpenAPI")
+
+    def _build_search_index(self) -> None:
+        # Mount the specs first so the index is built from the whole catalog
+        self._load_openapi()
+        index = SearchIndex(config.urls)
+        self.call_from_thread(setattr, self, "search_index", index)
 
     def action_toggle_dark(self) -> None:
         self.dark = not self.dark
@@ -86,10 +191,28 @@ class APITester(App):
                 self.auth()
 
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
-        if event.node.data:
-            qc = self.query_one("#query-container")
-            qc.remove_children()
-            qc.mount(Endpoint(event.node.data["url"]))
+        if isinstance(event.node.data, dict) and "url" in event.node.data:
+            self._open(event.node.data["url"])
+
+    def _open(self, url) -> None:
+        qc = self.query_one("#query-container")
+        qc.remove_children()
+        qc.mount(Endpoint(url))
+
+    def action_search(self):
+        if self.search_index is None:
+            self.notify("Still indexing, try again in a moment", title="Search")
+            return
+
+        self.push_screen(SearchScreen(self.search_index), self._found)
+
+    def _found(self, path: str | None) -> None:
+        if not path:
+            return
+
+        tree = self.query_one(URLTree)
+        tree.reveal(path)
+        self._open(config.select(path)[path])
 
     def action_add_url(self):
         self.push_screen(AddURLScreen(), lambda ok: self._reload() if ok else None)
@@ -97,6 +220,29 @@ class APITester(App):
     def action_plugin_list(self):
         self.push_screen(PluginScreen())
 
+    def action_load_test(self):
+        if not (endpoints := self.query(Endpoint)):
+            self.notify("Select an endpoint first", title="Load Test")
+            return
+
+        endpoint = endpoints.first()
+        self.push_screen(LoadTestScreen(), lambda params: endpoint.load_test(params) if params else None)
+
+    def action_history(self):
+        if not (endpoints := self.query(Endpoint)):
+            self.notify("Select an endpoint first", title="History")
+            return
+
+        self.push_screen(HistoryScreen(self.history_store, endpoints.first().key))
+
+    def action_fan_out(self):
+        if not (endpoints := self.query(Endpoint)):
+            self.notify("Select an endpoint first", title="Fan Out")
+            return
+
+        endpoint = endpoints.first()
+        self.push_screen(FanOutScreen(endpoint.url, endpoint.key))
+
     def action_try_quit(self) -> None:
         """Action to display the quit dialog."""
 
@@ -1,9 +1,25 @@
 # Locals
 from .add_url import AddURLScreen
 from .api_key import APIKeyScreen
+from .fan_out import FanOutScreen
+from .history import HistoryScreen
+from .load_test import LoadTest, LoadTestScreen
 from .login import LoginScreen
 from .plugin_list import PluginScreen
 from .quit import QuitScreen
+from .search import SearchScreen
 from .basic_auth_form import BasicAuthScreen
 
-__all__ = ["AddURLScreen", "APIKeyScreen", "LoginScreen", "QuitScreen", "PluginScreen", "BasicAuthScreen"]
+__all__ = [
+    "AddURLScreen",
+    "APIKeyScreen",
+    "LoginScreen",
+    "QuitScreen",
+    "PluginScreen",
+    "BasicAuthScreen",
+    "LoadTest",
+    "LoadTestScreen",
+    "HistoryScreen",
+    "FanOutScreen",
+    "SearchScreen",
+]
@@ -0,0 +1,115 @@
+# Standard Library
+import asyncio
+
+# Third Party
+from textual import work
+from textual.app import ComposeResult
+from textual.containers import Grid, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, DataTable, Input, Label
+
+# First Party
+from apitester.config import config
+from apitester.fanout import fan_out, parse_bindings
+from apitester.history import HistoryStore
+from apitester.plugin_manager import PluginManager
+from apitester.session import SessionManager
+from apitester.url import URL
+
+
+class FanOutScreen(ModalScreen[None]):
+    """Call an endpoint once for each of a list of variable values."""
+
+    BINDINGS = [("escape", "dismiss", "Cancel")]
+    AUTO_FOCUS = "#fanout-input"
+
+    DEFAULT_CSS = """
+    FanOutScreen #dialog {
+        height: 90%;
+        width: 90%;
+    }
+    FanOutScreen DataTable {
+        height: 1fr;
+    }
+    """
+
+    def __init__(self, url: URL, key: str, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.url = url
+        self.key = key
+        self.variables = sorted(url.variables())
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="dialog"):
+            yield Label(f"Fan out: {self.url.url}", classes="title")
+            yield Input(
+                placeholder=f"{', '.join(self.variables)} values, CSV rows split by ; or a CSV file path", id="fanout-input"
+            )
+            yield Label("", id="fanout-status")
+            yield DataTable(id="fanout-results", zebra_stripes=True)
+            with Grid(id="dialog-buttons"):
+                yield Button("Run", variant="primary", id="run")
+                yield Button("Close", id="close")
+
+    def on_mount(self) -> None:
+        self.query_one(DataTable).add_columns("#", *self.variables, "Status", "Latency", "Attempts")
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        self.run_bindings(event.value)
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        match event.button.id:
+            case "run":
+                self.run_bindings(self.query_one("#fanout-input", Input).value)
+            case _:
+                self.dismiss()
+
+    @work(exclusive=True)
+    async def run_bindings(self, text: str) -> None:
+        status = self.query_one("#fanout-status", Label)
+        try:
+            bindings = parse_bindings(text, self.variables)
+        except (OSError, ValueError) as e:
+            status.update(str(e))
+            return
+
+        sessions: SessionManager = getattr(self.app, "session_manager")
+        history: HistoryStore = getattr(self.app, "history_store")
+
+        table = self.query_one(DataTable)
+        table.clear()
+        rows = [
+            table.add_row(str(i + 1), *(b.get(v, self.url[v] if v in self.url else "") for v in self.variables), "…", "", "")
+            for i, b in enumerate(bindings)
+        ]
+        columns = list(table.columns)
+
+        done = failed = 0
+        status.update(f"0/{len(bindings)}")
+        self.query_one("#run", Button).disabled = True
+        try:
+            async for result in fan_out(sessions, self.url, bindings, PluginManager.instance(), config.fanout):
+                done += 1
+                failed += result.status is None or result.status >= 400
+
+                row = rows[result.index]
+                latency = f"{result.elapsed_ms:.1f}ms" if result.elapsed_ms is not None else ""
+                table.update_cell(row, columns[-3], str(result.status) if result.error is None else result.error)
+                table.update_cell(row, columns[-2], latency)
+                table.update_cell(row, columns[-1], str(result.attempts))
+                status.update(f"{done}/{len(bindings)}, {failed} failed")
+
+                await asyncio.to_thread(
+                    history.record,
+                    self.key,
+                    self.url.method,
+                    result.url,
+                    result.variables,
+                    result.status,
+                    result.headers,
+                    result.timing.as_dict() if result.timing else {},
+                    result.body,
+                    result.content_type,
+                )
+        finally:
+            self.query_one("#run", Button).disabled = False
@@ -0,0 +1,92 @@
+# Standard Library
+import asyncio
+
+# Third Party
+from rich.style import Style
+from textual import work
+from textual.app import ComposeResult
+from textual.containers import Container, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, Label, OptionList
+
+# First Party
+from apitester.history import HistoryEntry, HistoryStore, diff
+from apitester.widgets.response import BodyText
+
+
+class DiffText(BodyText):
+    styles_by_prefix = {"+": Style(color="green"), "-": Style(color="red"), "@": Style(color="cyan")}
+
+    def line_style(self, line: str) -> Style:
+        return self.rich_style + self.styles_by_prefix.get(line[:1], Style())
+
+
+class HistoryScreen(ModalScreen[None]):
+    """Past responses for an endpoint, pick two to see what changed between them."""
+
+    BINDINGS = [("escape", "dismiss", "Cancel")]
+    AUTO_FOCUS = "OptionList"
+
+    DEFAULT_CSS = """
+    HistoryScreen #dialog {
+        height: 90%;
+        width: 90%;
+    }
+    HistoryScreen OptionList {
+        height: 1fr;
+    }
+    HistoryScreen #diff {
+        height: 2fr;
+    }
+    HistoryScreen #diff > * {
+        height: 1fr;
+    }
+    """
+
+    def __init__(self, store: HistoryStore, endpoint: str, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.store = store
+        self.endpoint = endpoint
+        self.entries: list[HistoryEntry] = []
+        self.selected: HistoryEntry | None = None
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="dialog"):
+            yield Label("History", classes="title")
+            yield Label("Select two responses to compare", id="history-help")
+            yield OptionList(id="history")
+            yield Container(id="diff")
+            yield Button("Close", id="close")
+
+    def on_mount(self) -> None:
+        self.load_entries()
+
+    @work()
+    async def load_entries(self) -> None:
+        self.entries = await asyncio.to_thread(self.store.entries, self.endpoint)
+        options = self.query_one("#history", OptionList)
+        options.add_options([str(entry) for entry in self.entries])
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        entry = self.entries[event.option_index]
+        if self.selected is None or self.selected is entry:
+            self.selected = entry
+            self.query_one("#history-help", Label).update(f"Comparing from #{entry.id}, select another response")
+            return
+
+        self.show_diff(self.selected, entry)
+        self.selected = None
+
+    @work(exclusive=True)
+    async def show_diff(self, a: HistoryEntry, b: HistoryEntry) -> None:
+        # Older on the left, so additions are what the newer response gained
+        a, b = sorted((a, b), key=lambda entry: entry.id)
+        lines = await asyncio.to_thread(lambda: list(diff(self.store, a, b)))
+
+        self.query_one("#history-help", Label).update(f"#{a.id} → #{b.id}")
+        container = self.query_one("#diff")
+        container.remove_children()
+        container.mount(DiffText(lines))
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        self.dismiss()
@@ -0,0 +1,18 @@
+# Third Party
+from pydantic import BaseModel, ConfigDict
+
+# Locals
+from .modal_form import ModalFormScreen
+
+
+class LoadTest(BaseModel):
+    model_config = ConfigDict(title="Load Test")
+
+    concurrency: int = 10
+    rps: float = 0
+    duration: float = 10
+    requests: int = 0
+
+
+class LoadTestScreen(ModalFormScreen[LoadTest]):
+    model = LoadTest
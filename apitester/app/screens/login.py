@@ -4,17 +4,17 @@
 from typing import Any
 
 # Third Party
-import aiohttp
 from pydantic import BaseModel, ConfigDict
 from textual.widgets import Input
 
 # First Party
 from apitester.auth import auth
 from apitester.config import BearerAuthConf
-from apitester.utils import extract
+from apitester.session import SessionManager
+from apitester.tokens import TokenError
 
 # Locals
-from .modal_form import ModalFormScreen
+from .modal_form import ModalFormException, ModalFormScreen
 
 
 class LoginModel(BaseModel):
@@ -45,18 +45,21 @@ class LoginScreen(ModalFormScreen[LoginModel]):
         return {"username": auth.username, "password": auth.password}
 
     async def on_submit(self, model: LoginModel) -> None:
+        # Third Party
+        import aiohttp
+
         if model.remember:
             auth.store(model.username, model.password)
         else:
             auth.remove()
 
-        async with aiohttp.ClientSession() as session:
-            post_data = {
-                "username": model.username,
-                "password": model.password,
-            }
-            async with session.post(self.auth.url, data={**post_data}) as response:
-                json = await response.json()
-                auth["token"] = extract(json, self.auth.token_path)
+        sessions: SessionManager = getattr(self.app, "session_manager")
+        if sessions.tokens is None:
+            return
+
+        try:
+            await sessions.tokens.login(sessions, model.username, model.password, model.remember)
+        except (aiohttp.ClientError, TokenError) as e:
+            raise ModalFormException(str(e)) from e
 
         self.notify("Logged in ok", title="Auth")
@@ -15,7 +15,7 @@ class PluginScreen(ModalScreen[None]):
     AUTO_FOCUS = "Button"
 
     def compose(self) -> ComposeResult:
-        plugins = getattr(self.app, "plugin_manager", PluginManager(self.log))
+        plugins = PluginManager.instance()
 
         with VerticalScroll(id="dialog"):
             yield Label("Active Plugins", classes="title")
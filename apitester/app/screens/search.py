@@ -0,0 +1,67 @@
+# Third Party
+from rich.text import Text
+from textual import on
+from textual.app import ComposeResult
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Input, OptionList
+from textual.widgets.option_list import Option
+
+# First Party
+from apitester.search import SearchIndex
+
+
+class SearchScreen(ModalScreen[str | None]):
+    """Find an endpoint by name, tree path, url or method, dismissing with its path."""
+
+    BINDINGS = [("escape", "dismiss", "Cancel"), ("down", "focus_results", "Results")]
+    AUTO_FOCUS = "#search-input"
+
+    DEFAULT_CSS = """
+    SearchScreen {
+        align: center top;
+    }
+    SearchScreen #dialog {
+        margin-top: 2;
+        max-height: 80%;
+    }
+    SearchScreen OptionList {
+        height: auto;
+        max-height: 20;
+    }
+    """
+
+    def __init__(self, index: SearchIndex, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.index = index
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="dialog"):
+            yield Input(placeholder="Search endpoints", id="search-input")
+            yield OptionList(id="search-results")
+
+    @on(Input.Changed)
+    def search(self, event: Input.Changed) -> None:
+        results = self.query_one(OptionList)
+        results.clear_options()
+
+        for result in self.index.search(event.value):
+            label = Text(result.path, style="bold" if result.exact else "")
+            label.append(f"  {result.url.method} {result.url.url}", style="dim")
+            results.add_option(Option(label, id=result.path))
+
+        if results.option_count:
+            results.highlighted = 0
+
+    @on(Input.Submitted)
+    def submit(self) -> None:
+        results = self.query_one(OptionList)
+        if results.highlighted is not None:
+            self.dismiss(results.get_option_at_index(results.highlighted).id)
+
+    @on(OptionList.OptionSelected)
+    def select(self, event: OptionList.OptionSelected) -> None:
+        self.dismiss(event.option.id)
+
+    def action_focus_results(self) -> None:
+        self.query_one(OptionList).focus()
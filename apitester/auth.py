@@ -1,40 +1,123 @@
-# Third Party
-import keyring
-from keyring.errors import KeyringLocked
+# Standard Library
+import functools
+import time
+from contextlib import suppress
+from typing import Any
 
 # First Party
 from apitester.config import config
-from apitester.utils import suppress
+
+
+def _suppress_keyring(error: str, default=None):
+    """``utils.suppress`` for a keyring error, looked up at call time so keyring is only imported on first use."""
+
+    def decorator_suppress(func):
+        @functools.wraps(func)
+        def wrapper_suppress(*args, **kwargs):
+            # Third Party
+            from keyring import errors
+
+            with suppress(getattr(errors, error)):
+                return func(*args, **kwargs)
+            return default
+
+        return wrapper_suppress
+
+    return decorator_suppress
 
 
 class Auth:
-    def __init__(self) -> None:
+    def __init__(self, ttl: float | None = None) -> None:
         self._store: dict[str, str] = {}
+        self._ttl = ttl
+        self._cache: dict[tuple[str, str | None], tuple[float, Any]] = {}
+        self._generation = 0
+
+    @property
+    def ttl(self) -> float | None:
+        """Seconds a keyring lookup is reused for, from ``[keyring] ttl`` unless one was passed in."""
+        return self._ttl if self._ttl is not None else config.keyring.ttl
+
+    def _credential(self, username: str | None):
+        key = (config.service_name, username)
+        if (cached := self._cache.get(key)) is not None:
+            fetched, credential = cached
+            if (ttl := self.ttl) is None or time.monotonic() - fetched < ttl:
+                return credential
+
+        # Third Party
+        import keyring
+
+        generation = self._generation
+        credential = keyring.get_credential(*key)
+        # A lookup that overlapped a store or remove may have read the credential from before it
+        if generation == self._generation:
+            self._cache[key] = (time.monotonic(), credential)
+        return credential
 
     def _credentials(self):
-        return keyring.get_credential(config.service_name, None)
+        return self._credential(None)
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._cache.clear()
+
+    @_suppress_keyring("KeyringError")
+    def prefetch(self) -> None:
+        self._credentials()
 
     @property
-    @suppress(KeyringLocked)
+    @_suppress_keyring("KeyringLocked")
     def username(self) -> str | None:
         return credentials.username if (credentials := self._credentials()) else None
 
     @property
-    @suppress(KeyringLocked)
+    @_suppress_keyring("KeyringLocked")
     def password(self) -> str | None:
         return credentials.password if (credentials := self._credentials()) else None
 
-    @suppress(KeyringLocked)
+    @_suppress_keyring("KeyringLocked")
     def store(self, username: str, password: str) -> None:
+        # Third Party
+        import keyring
+
         keyring.set_password(config.service_name, username, password)
+        # Only once the write is done, or a lookup made during it could cache the old credential again
+        self.invalidate()
 
-    @suppress(KeyringLocked)
+    @_suppress_keyring("KeyringLocked")
     def remove(self) -> None:
-        if self.username:
-            keyring.delete_password(config.service_name, self.username)
+        # Third Party
+        import keyring
+
+        if username := self.username:
+            keyring.delete_password(config.service_name, username)
+            self.invalidate()
+
+    @property
+    def _token_service(self) -> str:
+        return f"{config.service_name}:token"
+
+    @_suppress_keyring("KeyringError")
+    def load_token(self) -> str | None:
+        # Third Party
+        import keyring
+
+        return keyring.get_password(self._token_service, "token")
+
+    @_suppress_keyring("KeyringError")
+    def store_token(self, token: str | None) -> None:
+        """Keep a serialised token in the keyring, under its own service so it is never mistaken for a login."""
+        # Third Party
+        import keyring
+
+        if token is None:
+            keyring.delete_password(self._token_service, "token")
+        else:
+            keyring.set_password(self._token_service, "token", token)
 
     def get(self, key) -> str | None:
-        if credential := keyring.get_credential(config.service_name, key):
+        if credential := self._credential(key):
             return credential.password
 
     def __setitem__(self, key: str, data: str) -> None:
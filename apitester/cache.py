@@ -0,0 +1,445 @@
+# Standard Library
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field, replace
+from email.message import Message
+from email.utils import parsedate_to_datetime
+from functools import cached_property
+from typing import Any, Literal, TYPE_CHECKING
+
+# First Party
+from apitester.config import CacheConf
+from apitester.response import loads
+
+if TYPE_CHECKING:
+    # Third Party
+    import aiohttp
+
+SCHEMA = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    vary TEXT NOT NULL,
+    requested REAL NOT NULL,
+    received REAL NOT NULL,
+    body BLOB NOT NULL,
+    stored INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+# Statuses a response can be stored for without saying how long it is fresh for (RFC 9110 15.1)
+HEURISTIC_STATUSES = {200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501}
+# Headers a 304 can't update on the stored response (RFC 9111 3.2)
+KEEP_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "content-range"}
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS", "TRACE"}
+
+
+def cache_control(value: str | None) -> dict[str, str | None]:
+    """The directives in a Cache-Control header, names lowercased and quotes taken off values."""
+    directives: dict[str, str | None] = {}
+    for directive in (value or "").split(","):
+        name, _, argument = directive.partition("=")
+        if name := name.strip().lower():
+            directives[name] = argument.strip().strip('"') if argument else None
+
+    return directives
+
+
+def _seconds(value: str | None) -> int | None:
+    with suppress(TypeError, ValueError):
+        return max(int(value), 0)  # type: ignore[arg-type]
+
+    return None
+
+
+def _timestamp(value: str | None) -> float | None:
+    with suppress(TypeError, ValueError, IndexError):
+        return parsedate_to_datetime(value).timestamp()  # type: ignore[arg-type]
+
+    return None
+
+
+def _header(headers: Iterable[tuple[str, str]], name: str) -> str | None:
+    return next((value for key, value in headers if key.lower() == name), None)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A stored response, with the request header values it was selected by and when it was fetched."""
+
+    url: str
+    status: int
+    headers: tuple[tuple[str, str], ...]
+    body: bytes
+    vary: dict[str, str | None] = field(default_factory=dict)
+    requested: float = 0.0
+    received: float = 0.0
+
+    def header(self, name: str) -> str | None:
+        return _header(self.headers, name)
+
+    @cached_property
+    def directives(self) -> dict[str, str | None]:
+        return cache_control(", ".join(value for key, value in self.headers if key.lower() == "cache-control"))
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    @property
+    def lifetime(self) -> float:
+        """How long the response is fresh for (RFC 9111 4.2.1), with the usual 10% of its age since
+        Last-Modified when the server didn't say."""
+        if "no-cache" in self.directives:
+            return 0.0
+        if (max_age := _seconds(self.directives.get("max-age"))) is not None:
+            return float(max_age)
+
+        date = _timestamp(self.header("date")) or self.received
+        if "expires" in {key.lower() for key, _ in self.headers}:
+            expires = _timestamp(self.header("expires"))
+            return max(expires - date, 0.0) if expires is not None else 0.0
+
+        if self.status in HEURISTIC_STATUSES and (modified := _timestamp(self.header("last-modified"))) is not None:
+            return max(date - modified, 0.0) / 10
+
+        return 0.0
+
+    def age(self, now: float | None = None) -> float:
+        """The current age of the response (RFC 9111 4.2.3)."""
+        date = _timestamp(self.header("date")) or self.received
+        age = _seconds(self.header("age")) or 0
+        initial = max(self.received - date, 0.0, age + self.received - self.requested)
+        return initial + (now or time.time()) - self.received
+
+    def fresh(self, max_age: int | None = None) -> bool:
+        age = self.age()
+        return age < self.lifetime and (max_age is None or age <= max_age)
+
+    def matches(self, headers: dict[str, str]) -> bool:
+        """Whether a request with ``headers`` (names lowercased) would select this response (RFC 9111 4.1)."""
+        return all(headers.get(name) == value for name, value in self.vary.items())
+
+    @property
+    def validators(self) -> dict[str, str]:
+        conditional = {}
+        if etag := self.header("etag"):
+            conditional["If-None-Match"] = etag
+        if modified := self.header("last-modified"):
+            conditional["If-Modified-Since"] = modified
+        return conditional
+
+    def freshen(self, headers: Iterable[tuple[str, str]], requested: float, received: float) -> "CacheEntry":
+        """This response with the headers of a 304 that revalidated it (RFC 9111 4.3.4)."""
+        updated = {key.lower() for key, _ in headers} - KEEP_HEADERS
+        kept = [(key, value) for key, value in self.headers if key.lower() not in updated]
+        new = [(key, value) for key, value in headers if key.lower() in updated]
+        return replace(self, headers=tuple(kept + new), requested=requested, received=received)
+
+
+def storable(method: str, response: "aiohttp.ClientResponse") -> bool:
+    """Whether a private cache may store a response (RFC 9111 3), redirected responses are left alone."""
+    directives = cache_control(", ".join(response.headers.getall("Cache-Control", [])))
+    if method != "GET" or response.history or "no-store" in directives:
+        return False
+    if any(name.strip() == "*" for name in response.headers.get("Vary", "").split(",")):
+        return False
+
+    explicit = bool({"public", "private", "max-age"} & directives.keys()) or "Expires" in response.headers
+    return response.status in HEURISTIC_STATUSES or explicit and response.status not in (206, 304)
+
+
+class _Content:
+    def __init__(self, body: bytes, rest: "aiohttp.StreamReader | None" = None) -> None:
+        self.body = body
+        self.rest = rest
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        for i in range(0, len(self.body), n):
+            yield self.body[i : i + n]
+
+        if self.rest is not None:
+            async for chunk in self.rest.iter_chunked(n):
+                yield chunk
+
+    async def read(self) -> bytes:
+        return self.body + (await self.rest.read() if self.rest is not None else b"")
+
+
+class CachedResponse:
+    """Enough of an ``aiohttp.ClientResponse`` to read a stored body, or one the cache had to read the start of."""
+
+    def __init__(
+        self, status: int, headers: Iterable[tuple[str, str]], body: bytes, rest: "aiohttp.StreamReader | None" = None
+    ) -> None:
+        # Third Party
+        from multidict import CIMultiDict, CIMultiDictProxy
+
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.content = _Content(body, rest)
+
+        message = Message()
+        message["content-type"] = self.headers.get("Content-Type", "application/octet-stream")
+        self.content_type = message.get_content_type()
+        self.charset = message.get_content_charset()
+
+    async def read(self) -> bytes:
+        return await self.content.read()
+
+    async def text(self) -> str:
+        return (await self.read()).decode(self.charset or "utf-8", errors="replace")
+
+    async def json(self) -> Any:
+        return loads(await self.read())
+
+    def release(self) -> None:
+        pass
+
+
+@dataclass
+class CacheStatus:
+    """How the cache dealt with a request, and the body bytes that didn't have to be downloaded."""
+
+    outcome: Literal["hit", "revalidated", "fetched", "bypassed"] = "bypassed"
+    saved: int = 0
+    stored: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"outcome": self.outcome, "saved_bytes": self.saved, "stored": self.stored}
+
+
+class HTTPCache:
+    """A private HTTP cache for GET requests, following the parts of RFC 9111 a single client needs.
+
+    Responses are kept in a memory LRU bounded by body bytes, and written through to sqlite, which is
+    bounded by stored bytes and evicts the least recently used first. One response is kept per URL,
+    a request whose Vary headers don't match it replaces it.
+    """
+
+    def __init__(self, conf: CacheConf | None = None) -> None:
+        self.conf = conf or CacheConf()
+        self.saved = 0
+        self._memory: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._memory_bytes = 0
+        # When responses answered from memory were last used, written to disk before evicting from it
+        self._touched: dict[str, float] = {}
+        # The memory LRU is looked up on the event loop, so it has its own lock rather than waiting on sqlite writes.
+        # Where both are needed _lock is taken first.
+        self._memory_lock = threading.RLock()
+        self._lock = threading.RLock()
+        self._connection: sqlite3.Connection | None = None
+        self._bytes = 0
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.conf.path, check_same_thread=False)
+            self._connection.executescript(SCHEMA)
+            (self._bytes,) = self._connection.execute("SELECT COALESCE(SUM(stored), 0) FROM responses").fetchone()
+
+        return self._connection
+
+    def _remember(self, entry: CacheEntry) -> None:
+        with self._memory_lock:
+            self._forget(entry.url)
+            if entry.size <= self.conf.memory_bytes:
+                self._memory[entry.url] = entry
+                self._memory_bytes += entry.size
+
+            while self._memory_bytes > self.conf.memory_bytes:
+                self._memory_bytes -= self._memory.popitem(last=False)[1].size
+
+    def _forget(self, url: str) -> None:
+        with self._memory_lock:
+            if (entry := self._memory.pop(url, None)) is not None:
+                self._memory_bytes -= entry.size
+
+    def cached(self, url: str) -> CacheEntry | None:
+        """The response for ``url`` if it is held in memory."""
+        with self._memory_lock:
+            if (entry := self._memory.get(url)) is not None:
+                self._memory.move_to_end(url)
+                self._touched[url] = time.time()
+            return entry
+
+    def get(self, url: str) -> CacheEntry | None:
+        """The response for ``url``, from memory or else from disk."""
+        if (entry := self.cached(url)) is not None:
+            return entry
+
+        with self._lock, self.connection:
+            row = self.connection.execute(
+                "SELECT status, headers, vary, requested, received, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self.connection.execute("UPDATE responses SET accessed = ? WHERE url = ?", (time.time(), url))
+
+        status, headers, vary, requested, received, body = row
+        headers = tuple(map(tuple, json.loads(headers)))
+        entry = CacheEntry(url, status, headers, zlib.decompress(body), json.loads(vary), requested, received)
+        self._remember(entry)
+        return entry
+
+    def put(self, entry: CacheEntry, body_changed: bool = True) -> None:
+        self._remember(entry)
+        headers = json.dumps(entry.headers)
+        # Compressed before taking the lock, so other requests' reads and writes aren't held up by it
+        body = zlib.compress(entry.body) if body_changed else None
+        with self._lock, self.connection:
+            now = time.time()
+            if body is None:
+                updated = self.connection.execute(
+                    "UPDATE responses SET headers = ?, requested = ?, received = ?, accessed = ? WHERE url = ?",
+                    (headers, entry.requested, entry.received, now, entry.url),
+                )
+                if updated.rowcount:
+                    return
+                body = zlib.compress(entry.body)
+
+            self._delete(entry.url)
+            vary = json.dumps(entry.vary)
+            self.connection.execute(
+                "INSERT INTO responses (url, status, headers, vary, requested, received, body, stored, accessed)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (entry.url, entry.status, headers, vary, entry.requested, entry.received, body, len(body), now),
+            )
+            self._bytes += len(body)
+            self._evict()
+
+    def invalidate(self, *urls: str) -> None:
+        with self._lock, self.connection:
+            for url in urls:
+                self._forget(url)
+                self._delete(url)
+
+    def _delete(self, url: str) -> None:
+        if row := self.connection.execute("DELETE FROM responses WHERE url = ? RETURNING stored", (url,)).fetchone():
+            self._bytes -= row[0]
+
+    def _write_touched(self) -> None:
+        with self._memory_lock:
+            touched, self._touched = self._touched, {}
+        if touched:
+            accessed = [(when, url) for url, when in touched.items()]
+            self.connection.executemany("UPDATE responses SET accessed = ? WHERE url = ?", accessed)
+
+    def _evict(self) -> None:
+        if (excess := self._bytes - self.conf.max_bytes) <= 0:
+            return
+
+        self._write_touched()
+        evicted = []
+        for url, stored in self.connection.execute("SELECT url, stored FROM responses ORDER BY accessed"):
+            evicted.append(url)
+            if (excess := excess - stored) <= 0:
+                break
+
+        for url in evicted:
+            self._forget(url)
+            self._delete(url)
+
+    @property
+    def stored_bytes(self) -> int:
+        return self._bytes
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                with self._connection:
+                    self._write_touched()
+                self._connection.close()
+                self._connection = None
+
+    @asynccontextmanager
+    async def fetch(
+        self,
+        url: str,
+        headers: dict[str, str],
+        send: Callable[[dict[str, str]], Awaitable["aiohttp.ClientResponse"]],
+        status: CacheStatus | None = None,
+    ) -> AsyncIterator["aiohttp.ClientResponse | CachedResponse"]:
+        """Answer a GET from the cache when it can, otherwise ``send`` it, conditionally if there is a
+        stale response to revalidate, and store what comes back."""
+        status = status if status is not None else CacheStatus()
+        request_headers = {name.lower(): value for name, value in headers.items()}
+        directives = cache_control(request_headers.get("cache-control"))
+        if "no-store" in directives:
+            async with _sent(send({})) as response:
+                yield response
+            return
+
+        entry = self.cached(url) or await asyncio.to_thread(self.get, url)
+        if entry is not None and not entry.matches(request_headers):
+            entry = None
+
+        if entry is not None and "no-cache" not in directives and entry.fresh(_seconds(directives.get("max-age"))):
+            status.outcome, status.saved = "hit", entry.size
+            self.saved += entry.size
+            yield CachedResponse(entry.status, entry.headers, entry.body)
+            return
+
+        requested = time.time()
+        async with _sent(send(entry.validators if entry is not None else {})) as response:
+            received = time.time()
+            if entry is not None and response.status == 304:
+                entry = entry.freshen(response.headers.items(), requested, received)
+                await asyncio.to_thread(self.put, entry, False)
+                status.outcome, status.saved = "revalidated", entry.size
+                self.saved += entry.size
+                yield CachedResponse(entry.status, entry.headers, entry.body)
+                return
+
+            status.outcome = "fetched"
+            vary = {name.strip().lower() for name in response.headers.get("Vary", "").split(",") if name.strip()}
+            fetched = CacheEntry(
+                url,
+                response.status,
+                tuple(response.headers.items()),
+                b"",
+                {name: request_headers.get(name) for name in vary},
+                requested,
+                received,
+            )
+            # A response that is never fresh and has nothing to revalidate it with could never be used
+            if not storable("GET", response) or (fetched.lifetime == 0 and not fetched.validators):
+                if entry is not None:
+                    await asyncio.to_thread(self.invalidate, url)
+                yield response
+                return
+
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                body += chunk
+                if len(body) > self.conf.max_body:
+                    # Too big to keep, so hand on what was read so far followed by the rest of the stream
+                    yield CachedResponse(response.status, response.headers.items(), bytes(body), response.content)
+                    return
+
+            entry = replace(fetched, body=bytes(body))
+            await asyncio.to_thread(self.put, entry)
+            status.stored = True
+            yield CachedResponse(entry.status, entry.headers, entry.body)
+
+
+@asynccontextmanager
+async def _sent(response: Awaitable["aiohttp.ClientResponse"]) -> AsyncIterator["aiohttp.ClientResponse"]:
+    sent = await response
+    try:
+        yield sent
+    finally:
+        sent.release()
@@ -0,0 +1,100 @@
+# Standard Library
+import argparse
+import asyncio
+import json
+import sys
+
+# First Party
+from apitester.profiling import profile
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="apitester", description="Small, Simple API Tester.")
+    parser.add_argument("--profile-startup", action="store_true", help="Report import and discovery timings on exit")
+    parser.add_argument("--watch", action="store_true", default=None, help="Reload api-conf.toml whenever it changes on disk")
+    commands = parser.add_subparsers(dest="command")
+
+    run = commands.add_parser("run", help="Call endpoints without the TUI and print the results as JSON lines")
+    run.add_argument("paths", nargs="*", default=[""], help="Tree paths to call, e.g. order.details (default: all)")
+    run.add_argument("-v", "--var", action="append", default=[], metavar="NAME=VALUE", help="Set a url variable")
+    run.add_argument("-f", "--vars-file", help="TOML or JSON file of url variables")
+    run.add_argument("-c", "--concurrency", type=int, default=4, help="Maximum requests in flight")
+
+    load = commands.add_parser("load", help="Load test a single endpoint and print a latency report")
+    load.add_argument("path", help="Tree path of the endpoint, e.g. order.list")
+    load.add_argument("-v", "--var", action="append", default=[], metavar="NAME=VALUE", help="Set a url variable")
+    load.add_argument("-f", "--vars-file", help="TOML or JSON file of url variables")
+    load.add_argument("-c", "--concurrency", type=int, default=10, help="Requests in flight")
+    load.add_argument("--rps", type=float, help="Target requests per second (default: as fast as possible)")
+    load.add_argument("-d", "--duration", type=float, help="Seconds to run for")
+    load.add_argument("-n", "--requests", type=int, help="Number of requests to make (default: 100)")
+
+    workflow = commands.add_parser("workflow", help="Run a workflow file and print a per-step latency report")
+    workflow.add_argument("path", help="TOML workflow file")
+    workflow.add_argument("-v", "--var", action="append", default=[], metavar="NAME=VALUE", help="Set a url variable")
+    workflow.add_argument("-f", "--vars-file", help="TOML or JSON file of url variables")
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = get_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        _main(parser, args)
+    finally:
+        if args.profile_startup:
+            print(profile.report(), file=sys.stderr)
+
+
+def _main(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    match args.command:
+        case "run":
+            with profile.phase("import runner"):
+                # First Party
+                from apitester.runner import load_variables, run_to_stream, select
+
+            try:
+                urls = select(args.paths)
+            except KeyError as e:
+                parser.error(f"unknown endpoint {e}")
+
+            variables = load_variables(args.vars_file, args.var)
+            ok = asyncio.run(run_to_stream(urls, variables, args.concurrency, sys.stdout))
+            sys.exit(0 if ok else 1)
+        case "load":
+            # First Party
+            from apitester.runner import load_test, load_variables, select
+
+            try:
+                urls = select([args.path])
+            except KeyError as e:
+                parser.error(f"unknown endpoint {e}")
+
+            if len(urls) != 1:
+                parser.error(f"{args.path} is not a single endpoint")
+
+            (url,) = urls.values()
+            variables = load_variables(args.vars_file, args.var)
+            report = asyncio.run(load_test(url, variables, args.concurrency, args.rps, args.duration, args.requests))
+            print(json.dumps(report, indent=2))
+        case "workflow":
+            # First Party
+            from apitester.runner import load_variables
+            from apitester.workflow import run_file, Workflow
+
+            try:
+                workflow = Workflow.load(args.path)
+            except (OSError, ValueError) as e:
+                parser.error(str(e))
+
+            report = asyncio.run(run_file(workflow, load_variables(args.vars_file, args.var)))
+            print(json.dumps(report.as_dict(), indent=2))
+            sys.exit(0 if report.ok else 1)
+        case _:
+            with profile.phase("import app"):
+                # First Party
+                from apitester.app import run
+
+            run(watch_config=args.watch)
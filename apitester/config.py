@@ -1,16 +1,20 @@
 # Standard Library
 import os
+import threading
 import tomllib
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Annotated, Any, Literal
 
 # Third Party
-from pydantic import BaseModel, BeforeValidator, ValidationError, WrapValidator
+from pydantic import BaseModel, BeforeValidator, PrivateAttr, ValidationError, WrapValidator
 from pydantic_settings import BaseSettings
 
 # First Party
 from apitester.types import URLMethod
-from apitester.url import URL
-from apitester.utils import deferedURLRender
+from apitester.url import DeferredURL, URL
+from apitester.utils import extract
 
 
 class Settings(BaseSettings):
@@ -22,6 +26,8 @@ class BearerAuthConf(BaseModel):
     url: str
     headers: list[str]
     token_path: str
+    expires_in: float | None = None
+    refresh_before: float = 60
 
 
 class HeaderAuthConf(BaseModel):
@@ -39,6 +45,61 @@ class NoAuthConf(BaseModel):
 AuthConf = BearerAuthConf | HeaderAuthConf | BasicAuthConf | NoAuthConf
 
 
+class ResponseConf(BaseModel):
+    max_memory: int = 8 * 1024 * 1024
+    chunk_size: int = 64 * 1024
+    lazy_over: int = 1024 * 1024
+
+
+class HistoryConf(BaseModel):
+    path: str = ".apitester-history.db"
+    max_entries: int = 10_000
+    max_bytes: int = 64 * 1024 * 1024
+    max_body: int = 4 * 1024 * 1024
+
+
+class KeyringConf(BaseModel):
+    ttl: float | None = None
+
+
+class CacheConf(BaseModel):
+    enabled: bool = False
+    path: str = ".apitester-cache.db"
+    memory_bytes: int = 32 * 1024 * 1024
+    max_bytes: int = 256 * 1024 * 1024
+    max_body: int = 8 * 1024 * 1024
+
+
+class FanOutConf(BaseModel):
+    concurrency: int = 8
+    rate_per_host: float = 0
+    retries: int = 2
+    backoff: float = 0.25
+    max_backoff: float = 5
+
+
+class WatchConf(BaseModel):
+    enabled: bool = False
+    debounce: float = 0.3
+    poll_interval: float = 1.0
+
+
+class OpenAPIConf(BaseModel):
+    path: str
+    name: str | None = None
+
+    @property
+    def key(self) -> str:
+        return self.name or Path(self.path).stem
+
+
+class SessionConf(BaseModel):
+    limit: int = 100
+    limit_per_host: int = 10
+    ttl_dns_cache: int | None = 300
+    keepalive_timeout: float = 30
+
+
 def validate_urldict(v, handler):
     passed = handler(v)
     if "url" in passed:
@@ -54,56 +115,198 @@ URLConf = dict[str, URLType | dict[str, URLType | URLDict]]
 
 class ConfigModel(BaseModel):
     auth: AuthConf = NoAuthConf()
+    session: SessionConf = SessionConf()
+    response: ResponseConf = ResponseConf()
+    history: HistoryConf = HistoryConf()
+    cache: CacheConf = CacheConf()
+    keyring: KeyringConf = KeyringConf()
+    fanout: FanOutConf = FanOutConf()
+    watch: WatchConf = WatchConf()
+    openapi: list[OpenAPIConf] = []
     urls: URLConf
 
+    _settings: Settings = PrivateAttr(default_factory=Settings)
+
     def model_post_init(self, __context: Any) -> None:
+        keys = [source.key for source in self.openapi]
+        if clashes := sorted({key for key in keys if key in self.urls or keys.count(key) > 1}):
+            raise ValueError(f"OpenAPI specs would replace urls: {', '.join(clashes)}, give them a different name")
+
         if hasattr(self.auth, "url"):
-            self.auth.url = deferedURLRender(getattr(self.auth, "url", ""), {"urls": self.urls}, self.settings.base_url)
+            self.auth.url = DeferredURL(getattr(self.auth, "url", ""), {"urls": self.urls}, self.settings.base_url)
 
     @property
     def settings(self) -> Settings:
-        return Settings()
+        """Read from the environment once per load, see ``Config.refresh_settings``."""
+        return self._settings
 
     def __getitem__(self, key: str) -> str:
-        return f"{Settings().base_url.strip('/')}/{str(self.urls[key]).strip('/')}"
+        return f"{self.settings.base_url.strip('/')}/{str(self.urls[key]).strip('/')}"
 
     @property
     def service_name(self) -> str:
         return f"apt-test:{self.settings.base_url}"
 
+    def select(self, path: str) -> dict[str, URL]:
+        """All URLs at or below a dotted tree path, keyed by their full path."""
+        return dict(iter_urls(extract(self.urls, path) if path else self.urls, path))
+
+
+def iter_urls(items: URL | dict, prefix: str = "") -> Iterator[tuple[str, URL]]:
+    if isinstance(items, URL):
+        yield prefix, items
+        return
+
+    for key, val in items.items():
+        yield from iter_urls(val, f"{prefix}.{key}" if prefix else key)
+
+
+@dataclass
+class ConfigDiff:
+    """What changed between two sets of urls, keyed by their full path."""
+
+    added: dict[str, URL] = field(default_factory=dict)
+    removed: dict[str, URL] = field(default_factory=dict)
+    changed: dict[str, URL] = field(default_factory=dict)
+    settings: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed or self.settings)
+
+
+def diff_urls(old: dict[str, URL], new: dict[str, URL]) -> ConfigDiff:
+    diff = ConfigDiff()
+    for path, url in new.items():
+        if path not in old:
+            diff.added[path] = url
+        elif old[path] != url:
+            diff.changed[path] = url
+
+    diff.removed = {path: url for path, url in old.items() if path not in new}
+    return diff
+
+
+def graft(old: dict, new: dict) -> None:
+    """Put the old URL objects, and what they have cached, back in place of any new ones equal to them."""
+    for key, val in new.items():
+        if key not in old:
+            continue
+        if isinstance(val, URL) and isinstance(old[key], URL) and old[key] == val:
+            new[key] = old[key]
+        elif isinstance(val, dict) and isinstance(old[key], dict):
+            graft(old[key], val)
+
 
 class Config:
+    """The parsed api-conf.toml, read the first time anything is looked up on it."""
+
     path: str
     _st_mtime: float
+    _raw: dict[str, Any] | None = None
     api_conf: ConfigModel | None = None
+    settings: Settings
 
     def __init__(self, path: str = "api-conf.toml") -> None:
         self.path = path
-        self.load()
+        self._lock = threading.RLock()
+        self._specs: dict[str, tuple[float, dict[str, dict[str, URL]]]] = {}
 
-    def load(self) -> None:
+    def load(self) -> ConfigDiff:
+        with self._lock:
+            return self._load()
+
+    def _load(self) -> ConfigDiff:
         with open(self.path) as f:
             content = f.read()
             raw_api_conf = tomllib.loads(content)
 
-        self.api_conf = ConfigModel(**raw_api_conf)
-        self._st_mtime = os.stat(self.path).st_mtime
-
-    def check_reload(self):
-        if self._st_mtime == os.stat(self.path).st_mtime:
-            return False
+        st_mtime = os.stat(self.path).st_mtime
+        if raw_api_conf == self._raw:
+            self._st_mtime = st_mtime
+            return ConfigDiff()
 
-        self.load()
-        return True
+        previous, previous_raw = self.api_conf, self._raw or {}
+        self.api_conf = ConfigModel(**raw_api_conf)
+        # A plain attribute, so reading it while rendering urls skips __getattr__ and pydantic
+        self.settings = self.api_conf.settings
+        self._mount_specs()
+        self._raw, self._st_mtime = raw_api_conf, st_mtime
+        if previous is None:
+            return ConfigDiff(added=dict(iter_urls(self.api_conf.urls)), settings=True)
+
+        graft(previous.urls, self.api_conf.urls)
+        diff = diff_urls(dict(iter_urls(previous.urls)), dict(iter_urls(self.api_conf.urls)))
+        diff.settings = {k: v for k, v in raw_api_conf.items() if k != "urls"} != {
+            k: v for k, v in previous_raw.items() if k != "urls"
+        }
+        return diff
+
+    def check_reload(self) -> ConfigDiff:
+        """Reload if the file has changed, safe to call from any thread."""
+        with self._lock:
+            if self.api_conf is not None and self._st_mtime == os.stat(self.path).st_mtime:
+                return ConfigDiff()
+
+            return self._load()
+
+    def _mount_specs(self) -> None:
+        for source in self.api_conf.openapi if self.api_conf is not None else []:
+            if source.path in self._specs:
+                self.api_conf.urls[source.key] = self._specs[source.path][1]
+
+    def load_openapi(self) -> ConfigDiff:
+        """Parse any new or changed OpenAPI spec and mount its urls, slow for big specs so keep it off the event loop."""
+        with self._lock:
+            if self.api_conf is None:
+                self._load()
+
+            stale = {}
+            for source in self.api_conf.openapi:
+                st_mtime = os.stat(source.path).st_mtime
+                if source.path not in self._specs or self._specs[source.path][0] != st_mtime:
+                    stale[source.path] = st_mtime
+
+        if not stale:
+            return ConfigDiff()
+
+        # First Party
+        from apitester import openapi
+
+        loaded = {path: (st_mtime, openapi.load(path)) for path, st_mtime in stale.items()}
+
+        with self._lock:
+            before = dict(iter_urls(self.api_conf.urls))
+            for path, (st_mtime, urls) in loaded.items():
+                if path in self._specs:
+                    graft(self._specs[path][1], urls)
+                self._specs[path] = (st_mtime, urls)
+            self._mount_specs()
+            return diff_urls(before, dict(iter_urls(self.api_conf.urls)))
+
+    def refresh_settings(self) -> bool:
+        """Read the environment again, returning whether the settings changed."""
+        with self._lock:
+            settings = Settings()
+            if self.api_conf is None or settings == self.api_conf.settings:
+                return False
+
+            self.api_conf._settings = self.settings = settings
+            if isinstance(auth_url := getattr(self.api_conf.auth, "url", None), DeferredURL):
+                auth_url.base_url = settings.base_url
+            return True
 
     def add_url(self, name: str, url: str, method: URLMethod):
         if self.api_conf is not None:
             self.api_conf.urls[name] = URL(url=url, method=method)
+            if isinstance(auth_url := getattr(self.api_conf.auth, "url", None), DeferredURL):
+                auth_url.invalidate()
 
         with open(self.path, "a") as f:
             f.write(f'\n# {name} = {{ url = "{url}", method = "{method}" }}')
 
     def __getattr__(self, __name: str) -> Any:
+        if self.api_conf is None:
+            self.load()
         return getattr(self.api_conf, __name)
 
 
@@ -1,34 +1,145 @@
 # Standard Library
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+import warnings
 from typing import Any
 
-# Third Party
-from tinydb import Query, TinyDB
+
+class KeyValueStore:
+    """Sqlite backed store with an in memory index.
+
+    Reads never touch the disk, writes are batched and flushed by a single background thread once the
+    store has been idle for ``flush_delay`` seconds, and again on exit.
+    """
+
+    def __init__(self, path: str = ".apitester.db", legacy_path: str = ".apitester.json", flush_delay: float = 0.5) -> None:
+        self.path = path
+        self.flush_delay = flush_delay
+        self._lock = threading.RLock()
+        self._wake = threading.Condition(self._lock)
+        self._dirty: set[str] = set()
+        self._deadline: float | None = None
+        self._flusher: threading.Thread | None = None
+        self._closed = False
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS store (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID")
+        self._index: dict[str, Any] = {
+            key: json.loads(value) for key, value in self._connection.execute("SELECT key, value FROM store")
+        }
+
+        # user_version is only set once the TinyDB file has been migrated, so a failed migration is tried again
+        if self._connection.execute("PRAGMA user_version").fetchone() == (0,):
+            self._migrate(legacy_path)
+
+        atexit.register(self.close)
+
+    def _migrate(self, legacy_path: str) -> None:
+        try:
+            if os.path.exists(legacy_path):
+                with open(legacy_path) as f:
+                    tables = json.load(f)
+                # TinyDB files are {table: {doc_id: document}}
+                values = {doc["key"]: doc.get("value") for docs in tables.values() for doc in docs.values() if "key" in doc}
+            else:
+                values = {}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            warnings.warn(f"Couldn't migrate {legacy_path}, it will be tried again next time: {e}")
+            return
+
+        with self._lock, self._connection:
+            # Anything already in the store was set after the legacy file was last written
+            values = {key: value for key, value in values.items() if key not in self._index}
+            self._connection.executemany(
+                "INSERT INTO store (key, value) VALUES (?, ?)", [(key, json.dumps(value)) for key, value in values.items()]
+            )
+            self._connection.execute("PRAGMA user_version = 1")
+            self._index.update(values)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._index.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            if key in self._index and self._index[key] == value:
+                return
+
+            self._index[key] = value
+            self._dirty.add(key)
+            self._deadline = time.monotonic() + self.flush_delay
+
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_when_idle, name="store-flusher", daemon=True)
+                self._flusher.start()
+            self._wake.notify()
+
+    def _flush_when_idle(self) -> None:
+        with self._wake:
+            while not self._closed:
+                if self._deadline is None:
+                    self._wake.wait()
+                elif (remaining := self._deadline - time.monotonic()) > 0:
+                    self._wake.wait(remaining)
+                else:
+                    self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._deadline = None
+            if not self._dirty:
+                return
+
+            rows = [(key, json.dumps(self._index[key])) for key in self._dirty]
+            self._dirty.clear()
+
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT INTO store (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                    rows,
+                )
+
+    def compact(self) -> None:
+        with self._lock:
+            (page_count,) = self._connection.execute("PRAGMA page_count").fetchone()
+            (free_count,) = self._connection.execute("PRAGMA freelist_count").fetchone()
+            if page_count and free_count / page_count > 0.25:
+                self._connection.execute("VACUUM")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+
+            self.flush()
+            self.compact()
+            self._connection.close()
+            self._closed = True
+            self._wake.notify()
+            atexit.unregister(self.close)
 
 
 class DataStore:
-    _db = None
+    _db: KeyValueStore | None = None
 
     def __init__(self, prefix: str | None = None) -> None:
         self._file_name = "store"
         self.prexif = prefix
 
     @property
-    def db(self) -> TinyDB:
+    def db(self) -> KeyValueStore:
         if self.__class__._db is None:
-            self.__class__._db = TinyDB(".apitester.json")
+            self.__class__._db = KeyValueStore()
         return self.__class__._db
 
     def _prefix_key(self, name):
         return f"{self.prexif}-{name}" if self.prexif is not None else name
 
     def __setitem__(self, name: str, value: Any) -> None:
-        kv = Query()
-        self.db.upsert({"key": self._prefix_key(name), "value": value}, kv.key == self._prefix_key(name))
+        self.db.set(self._prefix_key(name), value)
 
     def __getitem__(self, name: str) -> Any:
-        kv = Query()
-        try:
-            res = self.db.search(kv.key == self._prefix_key(name)).pop()
-            return res["value"]
-        except IndexError:
-            return ""
+        return self.db.get(self._prefix_key(name), "")
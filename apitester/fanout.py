@@ -0,0 +1,147 @@
+# Standard Library
+import asyncio
+import csv
+import io
+import os
+import random
+from collections.abc import AsyncIterator, Collection
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+# First Party
+from apitester.config import FanOutConf
+from apitester.plugin_manager import PluginManager
+from apitester.session import SessionManager, request_options
+from apitester.tokens import TokenError
+from apitester.tracing import RequestTiming
+from apitester.url import URL
+
+RETRY_STATUSES = {429, 502, 503, 504}
+
+
+def parse_bindings(text: str, variables: Collection[str]) -> list[dict[str, str]]:
+    """Variable bindings from pasted text or the path of a file.
+
+    A CSV whose header row names the url's variables gives one binding per row, otherwise a url with a
+    single variable takes every comma or newline separated value. Pasted text may separate rows with ``;``
+    as inputs only take a single line.
+    """
+    text = text.strip()
+    if text and "\n" not in text and os.path.isfile(path := os.path.expanduser(text)):
+        with open(path, newline="") as f:
+            text = f.read().strip()
+    else:
+        text = text.replace(";", "\n")
+
+    rows = [[cell.strip() for cell in row] for row in csv.reader(io.StringIO(text)) if any(cell.strip() for cell in row)]
+    if not rows:
+        return []
+
+    if set(rows[0]) <= set(variables) and len(set(rows[0])) == len(rows[0]):
+        return [dict(zip(rows[0], row)) for row in rows[1:]]
+
+    if len(variables) == 1:
+        (name,) = variables
+        return [{name: value} for row in rows for value in row if value]
+
+    raise ValueError(f"Add a header row naming the variables: {', '.join(sorted(variables))}")
+
+
+class HostRateLimiter:
+    """Spaces out requests to each host so none sees more than ``rate`` a second."""
+
+    def __init__(self, rate: float = 0) -> None:
+        self.rate = rate
+        self._next: dict[str, float] = {}
+
+    async def acquire(self, host: str) -> None:
+        if self.rate <= 0:
+            return
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(self._next.get(host, now), now)
+        self._next[host] = slot + 1 / self.rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+@dataclass
+class FanOutResult:
+    index: int
+    variables: dict[str, str]
+    url: str
+    status: int | None = None
+    attempts: int = 0
+    error: str | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes | None = None
+    content_type: str = ""
+    timing: RequestTiming | None = None
+
+    @property
+    def elapsed_ms(self) -> float | None:
+        return None if self.timing is None or self.timing.total is None else self.timing.total * 1000
+
+
+def _retry_after(headers: dict[str, str]) -> float | None:
+    try:
+        return float(headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+async def fan_out(
+    sessions: SessionManager,
+    url: URL,
+    bindings: list[dict[str, str]],
+    plugins: PluginManager | None = None,
+    conf: FanOutConf | None = None,
+) -> AsyncIterator[FanOutResult]:
+    """Call ``url`` once for each binding over the shared pool, yielding results as they finish."""
+    # Third Party
+    import aiohttp
+
+    plugins = plugins or PluginManager.instance()
+    conf = conf or FanOutConf()
+    semaphore = asyncio.Semaphore(conf.concurrency)
+    limiter = HostRateLimiter(conf.rate_per_host)
+
+    async def call(index: int, binding: dict[str, str]) -> FanOutResult:
+        values = {name: url[name] for name in url.variables() if name in url} | binding
+        result = FanOutResult(index, binding, url.resolve(values))
+        host = urlsplit(result.url).netloc
+        request_data = {f: values[f] for f in url.fields if f in values}
+
+        while True:
+            result.attempts += 1
+            result.timing = timing = RequestTiming()
+            retry_after = None
+            async with semaphore:
+                try:
+                    await limiter.acquire(host)
+                    options = request_options(plugins)
+                    async with sessions.request(
+                        url.method, result.url, data=request_data, timing=timing, **options
+                    ) as response:
+                        result.status, result.error = response.status, None
+                        result.headers = dict(response.headers)
+                        result.content_type = response.content_type
+                        result.body = await response.read()
+                    timing.finish(len(result.body))
+                    retry = response.status in RETRY_STATUSES
+                    retry_after = _retry_after(result.headers)
+                except (aiohttp.ClientError, asyncio.TimeoutError, TokenError) as e:
+                    timing.finish()
+                    result.error = f"{type(e).__name__}: {e}"
+                    retry = True
+
+            if not retry or result.attempts > conf.retries:
+                return result
+
+            # Exponential backoff with full jitter, or the server's Retry-After, capped either way
+            delay = min(conf.backoff * 2 ** (result.attempts - 1), conf.max_backoff)
+            await asyncio.sleep(min(retry_after, conf.max_backoff) if retry_after is not None else random.uniform(0, delay))
+
+    for task in asyncio.as_completed([call(index, binding) for index, binding in enumerate(bindings)]):
+        yield await task
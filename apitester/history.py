@@ -0,0 +1,226 @@
+# Standard Library
+import difflib
+import hashlib
+import json
+import mmap
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+# First Party
+from apitester.config import HistoryConf
+from apitester.response import loads
+
+SCHEMA = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+CREATE TABLE IF NOT EXISTS bodies (
+    digest TEXT PRIMARY KEY,
+    content_type TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored INTEGER NOT NULL,
+    data BLOB
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    variables TEXT NOT NULL,
+    status INTEGER,
+    headers TEXT NOT NULL,
+    timing TEXT NOT NULL,
+    digest TEXT,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_endpoint ON entries (endpoint, id);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest);
+"""
+
+
+@dataclass
+class HistoryEntry:
+    id: int
+    endpoint: str
+    method: str
+    url: str
+    status: int | None
+    digest: str | None
+    created: float
+    variables: dict[str, str] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+    timing: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "HistoryEntry":
+        id, endpoint, method, url, variables, status, headers, timing, digest, created = row
+        return cls(
+            id, endpoint, method, url, status, digest, created, json.loads(variables), json.loads(headers), json.loads(timing)
+        )
+
+    def __str__(self) -> str:
+        when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.created))
+        total = self.timing.get("total_ms")
+        latency = f" {total:.1f}ms" if total is not None else ""
+        return f"{when} {self.status or 'error'}{latency} {(self.digest or '')[:8]}"
+
+
+_COLUMNS = "id, endpoint, method, url, variables, status, headers, timing, digest, created"
+
+
+class HistoryStore:
+    """Every request made, in sqlite, bounded by entry count and stored body bytes.
+
+    Bodies are zlib compressed and keyed by the sha256 of their content, so repeated identical
+    responses are only stored once, and not at all when bigger than ``max_body`` or ``max_bytes``.
+    When a bound is passed the least recently used entries are evicted, along with any bodies nothing
+    refers to anymore.
+    """
+
+    def __init__(self, conf: HistoryConf | None = None) -> None:
+        self.conf = conf or HistoryConf()
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self.conf.path, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+
+        (self._count,) = self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+        (self._bytes,) = self._connection.execute("SELECT COALESCE(SUM(stored), 0) FROM bodies").fetchone()
+
+    def record(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        variables: dict[str, str],
+        status: int | None,
+        headers: dict[str, str],
+        timing: dict[str, Any],
+        body: bytes | bytearray | mmap.mmap | None = None,
+        content_type: str = "",
+    ) -> int:
+        digest = hashlib.sha256(body).hexdigest() if body is not None else None
+        now = time.time()
+
+        with self._lock, self._connection:
+            exists = digest is None or self._connection.execute("SELECT 1 FROM bodies WHERE digest = ?", (digest,)).fetchone()
+            if not exists:
+                data = zlib.compress(body) if len(body) <= self.conf.max_body else None
+                if data is not None and len(data) > self.conf.max_bytes:
+                    # Keeping it would evict every entry, this one included
+                    data = None
+                stored = len(data) if data is not None else 0
+                self._connection.execute(
+                    "INSERT INTO bodies (digest, content_type, size, stored, data) VALUES (?, ?, ?, ?, ?)",
+                    (digest, content_type, len(body), stored, data),
+                )
+                self._bytes += stored
+
+            cursor = self._connection.execute(
+                f"INSERT INTO entries ({_COLUMNS}, accessed) VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    endpoint,
+                    method,
+                    url,
+                    json.dumps(variables),
+                    status,
+                    json.dumps(headers),
+                    json.dumps(timing),
+                    digest,
+                    now,
+                    now,
+                ),
+            )
+            self._count += 1
+            self._evict()
+
+        return cursor.lastrowid or 0
+
+    def _evict(self) -> None:
+        if (excess := self._count - self.conf.max_entries) > 0:
+            self._evict_oldest(excess)
+
+        # Entries can share a body, so which one frees enough bytes is only known once they are gone
+        while self._bytes > self.conf.max_bytes and self._count:
+            self._evict_oldest(1)
+
+    def _evict_oldest(self, count: int) -> None:
+        ids = [id for (id,) in self._connection.execute("SELECT id FROM entries ORDER BY accessed, id LIMIT ?", (count,))]
+        marks = ",".join("?" * len(ids))
+        digests = self._connection.execute(f"SELECT DISTINCT digest FROM entries WHERE id IN ({marks})", ids).fetchall()
+        self._connection.execute(f"DELETE FROM entries WHERE id IN ({marks})", ids)
+        self._count -= len(ids)
+
+        for (digest,) in digests:
+            if digest and not self._connection.execute("SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+                (stored,) = self._connection.execute("SELECT stored FROM bodies WHERE digest = ?", (digest,)).fetchone()
+                self._connection.execute("DELETE FROM bodies WHERE digest = ?", (digest,))
+                self._bytes -= stored
+
+    def entries(self, endpoint: str, limit: int = 100) -> list[HistoryEntry]:
+        """The most recent entries for an endpoint, newest first."""
+        with self._lock, self._connection:
+            rows = self._connection.execute(
+                f"SELECT {_COLUMNS} FROM entries WHERE endpoint = ? ORDER BY id DESC LIMIT ?", (endpoint, limit)
+            ).fetchall()
+            # Listing an entry counts as using it, so what is shown is what is kept
+            ids = [row[0] for row in rows]
+            marks = ",".join("?" * len(ids))
+            self._connection.execute(f"UPDATE entries SET accessed = ? WHERE id IN ({marks})", (time.time(), *ids))
+        return [HistoryEntry.from_row(row) for row in rows]
+
+    def body(self, entry: HistoryEntry) -> tuple[str, bytes | None]:
+        """The content type and body of an entry, marking the entry as used."""
+        if entry.digest is None:
+            return "", None
+
+        with self._lock, self._connection:
+            self._connection.execute("UPDATE entries SET accessed = ? WHERE id = ?", (time.time(), entry.id))
+            row = self._connection.execute("SELECT content_type, data FROM bodies WHERE digest = ?", (entry.digest,)).fetchone()
+
+        if row is None:
+            return "", None
+        content_type, data = row
+        return content_type, zlib.decompress(data) if data is not None else None
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def stored_bytes(self) -> int:
+        return self._bytes
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def _normalise(content_type: str, body: bytes | None) -> list[str]:
+    if body is None:
+        return ["<body not stored>"]
+    if "json" in content_type:
+        try:
+            return json.dumps(loads(body), indent=2, sort_keys=True).splitlines()
+        except ValueError:
+            pass
+    return body.decode(errors="replace").splitlines()
+
+
+def diff(store: HistoryStore, a: HistoryEntry, b: HistoryEntry) -> Iterator[str]:
+    """Unified diff of two entries, JSON bodies are compared with their keys sorted."""
+    if a.status != b.status:
+        yield f"status: {a.status} -> {b.status}"
+    for key in ("total_ms", "ttfb_ms"):
+        if (before := a.timing.get(key)) is not None and (after := b.timing.get(key)) is not None:
+            yield f"{key}: {before:.1f} -> {after:.1f} ({after - before:+.1f})"
+
+    if a.digest == b.digest:
+        yield "bodies are identical"
+        return
+
+    yield from difflib.unified_diff(_normalise(*store.body(a)), _normalise(*store.body(b)), f"#{a.id}", f"#{b.id}", lineterm="")
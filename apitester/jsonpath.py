@@ -0,0 +1,493 @@
+# Standard Library
+import codecs
+import json
+import re
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import lru_cache
+from json.decoder import JSONDecodeError
+from typing import Any
+
+Step = tuple[Any, ...]
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"[ \t\n\r]*")
+_number_rest = re.compile(r"[0-9.eE+-]*\Z")
+_name = re.compile(r"[^.\[\]]+")
+_bracket = re.compile(
+    r"""\[\s*(?:
+        (?P<quoted>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+        |(?P<star>\*)
+        |(?P<slice>-?\d*\s*:\s*-?\d*(?:\s*:\s*-?\d*)?)
+        |(?P<index>-?\d+)
+    )\s*\]""",
+    re.VERBOSE,
+)
+_filter_open = re.compile(r"\[\s*\?\(")
+_filter_close = re.compile(r"\s*\]")
+# Quoted literals are kept whole so the operators and brackets inside them are left alone
+_filter_token = re.compile(r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|&&|\|\||[()]|[^'"&|()]+|[&|]""")
+# What skipping a value has to follow, a string that runs past the text read so far has no closing quote
+_structure = re.compile(r'[^"\[\]{}]*(?:(?P<string>"[^"\\]*(?:\\.[^"\\]*)*(?P<closed>")?)|(?P<bracket>[\[\]{}]))')
+_single_quoted = re.compile(r'\\.|"')
+_comparison = re.compile(r"^\s*(?P<path>@\S*?)\s*(?:(?P<op>==|!=|<=|>=|<|>)\s*(?P<literal>.+?))?\s*$")
+_operators: dict[str, Callable[[Any, Any], bool]] = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+class SelectorError(ValueError):
+    pass
+
+
+def _segment(name: str) -> Step:
+    if name == "*":
+        return ("wild",)
+    # A bare number could be an object key or a list index, it is decided by what it is applied to
+    return ("member", name) if name.lstrip("-").isdigit() else ("key", name)
+
+
+def _filter_tokens(text: str, index: int = 0) -> Iterator[tuple[str, int]]:
+    """Tokens of a filter expression from ``index`` on, each with where it ends."""
+    while index < len(text):
+        if not (match := _filter_token.match(text, index)):
+            raise SelectorError(f"Unterminated string in {text[index:]!r}")
+        index = match.end()
+        yield match.group(), index
+
+
+def _filter(text: str, start: int) -> tuple[str, int]:
+    """The expression of a filter whose ``(`` ends at ``start``, and where the step ends."""
+    depth = 0
+    for token, end in _filter_tokens(text, start):
+        if token == "(":
+            depth += 1
+        elif token == ")" and depth:
+            depth -= 1
+        elif token == ")":
+            if close := _filter_close.match(text, end):
+                return text[start : end - 1].strip(), close.end()
+            break
+
+    raise SelectorError(f"Can't parse the filter {text[start:]!r}")
+
+
+def parse(selector: str) -> tuple[Step, ...]:
+    """Steps of a selector, either a JSONPath subset or the older dotted form like ``data.orders.0.id``."""
+    text = selector.strip()
+    index = 1 if text.startswith("$") else 0
+    steps: list[Step] = []
+
+    while index < len(text):
+        if text.startswith("..", index):
+            steps.append(("descend",))
+            index += 2
+            if text.startswith("[", index):
+                continue
+        elif text[index] == ".":
+            index += 1
+        elif opening := _filter_open.match(text, index):
+            expression, index = _filter(text, opening.end())
+            steps.append(("filter", expression))
+            continue
+        elif text[index] == "[":
+            if not (match := _bracket.match(text, index)):
+                raise SelectorError(f"Can't parse {text[index:]!r} in {selector!r}")
+            if (quoted := match["quoted"]) is not None:
+                steps.append(("key", _unquote(quoted)))
+            elif match["star"]:
+                steps.append(("wild",))
+            elif (bounds := match["slice"]) is not None:
+                parts = [int(part) if part.strip() else None for part in bounds.split(":")]
+                if len(parts) == 3 and parts[2] == 0:
+                    raise SelectorError(f"Slice step can't be zero in {selector!r}")
+                steps.append(("slice", *(parts + [None])[:3]))
+            else:
+                steps.append(("index", int(match["index"])))
+            index = match.end()
+            continue
+        elif index:
+            raise SelectorError(f"Expected '.' or '[' at {text[index:]!r} in {selector!r}")
+
+        if not (match := _name.match(text, index)):
+            raise SelectorError(f"Expected a name at {text[index:]!r} in {selector!r}")
+        steps.append(_segment(match.group()))
+        index = match.end()
+
+    return tuple(steps)
+
+
+def _unquote(text: str) -> str:
+    """A quoted string with JSON escapes, in single quotes ``\\'`` is a quote and ``"`` needs no escape."""
+    if text[0] == "'":
+        escaped = {"\\'": "'", '"': '\\"'}
+        text = '"' + _single_quoted.sub(lambda match: escaped.get(match.group(), match.group()), text[1:-1]) + '"'
+    try:
+        return json.loads(text)
+    except JSONDecodeError as e:
+        raise SelectorError(f"Can't read {text!r} as a string") from e
+
+
+def _literal(text: str) -> Any:
+    if text[:1] == "'" and text[-1:] == "'":
+        return _unquote(text)
+    try:
+        return json.loads(text)
+    except JSONDecodeError as e:
+        raise SelectorError(f"Can't read {text!r} as a value") from e
+
+
+@lru_cache(maxsize=256)
+def _predicate(expression: str) -> Callable[[Any], bool]:
+    """A filter's test, comparisons against ``@`` joined with ``&&`` and ``||``, ``&&`` binding tighter."""
+
+    def comparison(text: str) -> Callable[[Any], bool]:
+        if not (match := _comparison.match(text)):
+            raise SelectorError(f"Can't parse the filter {text!r}")
+
+        selector = Selector(parse(match["path"][1:]), match["path"])
+        if match["op"] is None:
+            return lambda item: bool(selector.find(item))
+
+        op, literal = _operators[match["op"]], _literal(match["literal"])
+
+        def compare(item: Any) -> bool:
+            for value in selector.find(item):
+                try:
+                    if op(value, literal):
+                        return True
+                except TypeError:
+                    pass
+            return False
+
+        return compare
+
+    alternatives: list[list[Callable[[Any], bool]]] = [[]]
+    part = ""
+    for token, _ in _filter_tokens(expression):
+        if token in ("&&", "||"):
+            alternatives[-1].append(comparison(part))
+            part = ""
+            if token == "||":
+                alternatives.append([])
+        else:
+            part += token
+    alternatives[-1].append(comparison(part))
+
+    return lambda item: any(all(test(item) for test in branch) for branch in alternatives)
+
+
+def _children(node: Any) -> Iterable[Any]:
+    if isinstance(node, dict):
+        return node.values()
+    return node if isinstance(node, list) else ()
+
+
+def _descendants(node: Any) -> Iterator[Any]:
+    yield node
+    for child in _children(node):
+        yield from _descendants(child)
+
+
+def _in_slice(index: int, start: int | None, stop: int | None, step: int | None) -> bool:
+    start, step = start or 0, step or 1
+    return index >= start and (stop is None or index < stop) and (index - start) % step == 0
+
+
+@lru_cache(maxsize=1024)
+def _apply(step: Step) -> Callable[[Any], Iterable[Any]]:
+    match step:
+        case ("key", name):
+            return lambda node: (node[name],) if isinstance(node, dict) and name in node else ()
+        case ("member", name):
+
+            def member(node: Any) -> Iterable[Any]:
+                if isinstance(node, dict):
+                    return (node[name],) if name in node else ()
+                return _apply(("index", int(name)))(node)
+
+            return member
+        case ("index", index):
+            return lambda node: (node[index],) if isinstance(node, list) and -len(node) <= index < len(node) else ()
+        case ("slice", start, stop, every):
+            return lambda node: node[start:stop:every] if isinstance(node, list) else ()
+        case ("wild",):
+            return _children
+        case ("descend",):
+            return _descendants
+        case ("filter", expression):
+            test = _predicate(expression)
+            return lambda node: [child for child in _children(node) if test(child)]
+
+    raise SelectorError(f"Unknown step {step!r}")
+
+
+class Selector:
+    """A compiled selector.
+
+    ``find`` returns every match, ``extract`` returns the value itself for selectors that can only match one
+    thing (keys and indices only) and raises KeyError when it is missing.
+    """
+
+    __slots__ = ("text", "steps", "definite", "_functions")
+
+    def __init__(self, steps: tuple[Step, ...], text: str = "") -> None:
+        self.text = text
+        self.steps = steps
+        self.definite = all(step[0] in ("key", "member", "index") for step in steps)
+        self._functions = [_apply(step) for step in steps]
+
+    def __repr__(self) -> str:
+        return f"Selector({self.text!r})"
+
+    def find(self, document: Any) -> list[Any]:
+        nodes = [document]
+        for function in self._functions:
+            nodes = [match for node in nodes for match in function(node)]
+        return nodes
+
+    def first(self, document: Any, default: Any = None) -> Any:
+        return matches[0] if (matches := self.find(document)) else default
+
+    def extract(self, document: Any) -> Any:
+        if not self.definite:
+            return self.find(document)
+
+        node = document
+        for kind, key in self.steps:
+            try:
+                node = node[int(key)] if kind == "member" and isinstance(node, list) else node[key]
+            except (IndexError, TypeError, KeyError):
+                raise KeyError(key) from None
+        return node
+
+
+@lru_cache(maxsize=1024)
+def compile_selector(selector: str) -> Selector:
+    return Selector(parse(selector), selector)
+
+
+class _Trie:
+    __slots__ = ("ends", "children", "functions", "indefinite")
+
+    def __init__(self, step: Step | None = None) -> None:
+        self.ends: list[tuple[str, bool]] = []
+        self.children: dict[Step, _Trie] = {}
+        # The steps from the parent to here, more than one once a chain without branches is joined up
+        self.functions = [_apply(step)] if step is not None else []
+        # Whether a selector ending at or below here wants an empty list when nothing matches
+        self.indefinite = False
+
+    def join_chains(self) -> None:
+        for step, child in self.children.items():
+            while len(child.children) == 1 and not child.ends:
+                (only,) = child.children.values()
+                only.functions = child.functions + only.functions
+                child = only
+            self.children[step] = child
+            child.join_chains()
+
+
+def _visit(trie: _Trie, nodes: list[Any], results: dict[str, Any]) -> None:
+    for name, definite in trie.ends:
+        if not definite:
+            results[name] = nodes
+        elif nodes:
+            results[name] = nodes[0]
+
+    for child in trie.children.values():
+        matches = nodes
+        for function in child.functions:
+            if not (matches := [match for node in matches for match in function(node)]):
+                break
+
+        if matches or child.indefinite:
+            _visit(child, matches, results)
+
+
+class SelectorSet:
+    """Several selectors evaluated together, walking any steps they start with in common only once.
+
+    That pays off when what they share is a filter or ``..``, which would otherwise be run for each of them.
+    When all they share is a few keys it is no faster than finding each selector on its own.
+    """
+
+    def __init__(self, selectors: Mapping[str, str]) -> None:
+        self._root = _Trie()
+        for name, text in selectors.items():
+            compiled = compile_selector(text)
+            node = self._root
+            node.indefinite |= not compiled.definite
+            for step in compiled.steps:
+                if step not in node.children:
+                    node.children[step] = _Trie(step)
+                node = node.children[step]
+                node.indefinite |= not compiled.definite
+            node.ends.append((name, compiled.definite))
+        self._root.join_chains()
+
+    def evaluate(self, document: Any) -> dict[str, Any]:
+        """Each selector's value, or list of matches when it can match more than one; missing values are left out."""
+        results: dict[str, Any] = {}
+        _visit(self._root, [document], results)
+        return results
+
+
+class _Reader:
+    """Pulls JSON text from chunks as it is needed, dropping what has been read."""
+
+    def __init__(self, chunks: Iterable[bytes | str]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.dropped = 0
+        self.eof = False
+
+    @property
+    def offset(self) -> int:
+        return self.dropped + self.pos
+
+    def _fill(self, at_least: int = 1) -> bool:
+        if self.pos > 65536:
+            self.text, self.pos, self.dropped = self.text[self.pos :], 0, self.dropped + self.pos
+
+        added = 0
+        while added < at_least and not self.eof:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self.eof = True
+                chunk = self._decoder.decode(b"", final=True)
+            else:
+                chunk = chunk if isinstance(chunk, str) else self._decoder.decode(chunk)
+            self.text += chunk
+            added += len(chunk)
+        return added > 0
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _whitespace.match(self.text, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.text) or not self._fill():
+                return self.text[self.pos : self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise JSONDecodeError(f"Expecting {char!r}", self.text, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except JSONDecodeError:
+                # Incomplete, read at least as much again so a long value isn't decoded over and over
+                if not self._fill(max(len(self.text) - self.pos, 1)):
+                    raise
+                continue
+
+            # A number running to the end of the text, or only followed by the start of its fraction or
+            # exponent, may carry on in the next chunk
+            if _number_rest.match(self.text, end) and self._fill():
+                continue
+
+            self.pos = end
+            return value
+
+    def skip(self) -> None:
+        """Move past the value at the current position, following only its strings and brackets."""
+        if self.peek() not in ("{", "["):
+            self.value()
+            return
+
+        depth = 0
+        while True:
+            match = _structure.match(self.text, self.pos)
+            if match is None or (match["string"] is not None and match["closed"] is None):
+                if match is None:
+                    self.pos = len(self.text)
+                if not self._fill(max(len(self.text) - self.pos, 1)):
+                    raise JSONDecodeError("Unterminated value", self.text, self.pos)
+                continue
+
+            self.pos = match.end()
+            if (bracket := match["bracket"]) is not None:
+                depth += 1 if bracket in "[{" else -1
+                if not depth:
+                    return
+
+    def members(self) -> Iterator[tuple[str | int, bool]]:
+        """Keys or indices of the container at the current position, leaving the reader at each value."""
+        closing = "}" if self.peek() == "{" else "]"
+        self.pos += 1
+        index = 0
+        while self.peek() != closing:
+            if index:
+                self.expect(",")
+            if closing == "}":
+                key = self.value()
+                self.expect(":")
+            else:
+                key = index
+            start = self.offset
+            yield key, closing == "]"
+            if self.offset == start:
+                # The caller didn't read the value
+                self.skip()
+            index += 1
+        self.pos += 1
+
+
+def stream(selector: str | Selector, chunks: Iterable[bytes | str]) -> Iterator[Any]:
+    """Matches of ``selector`` in a JSON document read from ``chunks``.
+
+    Keys and indices are followed without decoding anything beside them, and an array or object that a
+    wildcard, slice or filter applies to is decoded one element at a time, so a huge array is never held in
+    memory all at once. Anything the reader can't follow, like ``..`` or negative indices, decodes the rest
+    of that value whole.
+    """
+    compiled = compile_selector(selector) if isinstance(selector, str) else selector
+    reader = _Reader(chunks)
+    steps = compiled.steps
+
+    for position, step in enumerate(steps):
+        container = reader.peek()
+        kind = step[0]
+
+        if kind in ("key", "member", "index") and container in ("{", "["):
+            wanted = step[1] if kind == "key" else int(step[1]) if container == "[" else step[1]
+            if (kind == "key" and container == "[") or (kind == "index" and container == "{"):
+                return
+            if isinstance(wanted, int) and wanted < 0:
+                break
+            for key, _ in reader.members():
+                if key == wanted:
+                    break
+            else:
+                return
+            continue
+
+        if kind in ("wild", "slice", "filter") and container in ("{", "["):
+            if kind == "slice" and any(bound is not None and bound < 0 for bound in step[1:]):
+                break
+            rest = Selector(steps[position + 1 :])
+            test = _predicate(step[1]) if kind == "filter" else None
+            for key, in_array in reader.members():
+                if kind == "slice" and not (in_array and _in_slice(int(key), *step[1:])):
+                    continue
+                value = reader.value()
+                if test is None or test(value):
+                    yield from rest.find(value)
+            return
+
+        break
+    else:
+        yield reader.value()
+        return
+
+    yield from Selector(steps[position:]).find(reader.value())
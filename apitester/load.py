@@ -0,0 +1,182 @@
+# Standard Library
+import asyncio
+import math
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# First Party
+from apitester.plugin_manager import PluginManager
+from apitester.session import SessionManager, request_options
+from apitester.url import URL
+
+
+class Histogram:
+    """HDR style log-linear histogram of microsecond values.
+
+    Values below ``2 ** sub_bucket_bits`` are counted exactly, above that each power of two is split into
+    ``2 ** (sub_bucket_bits - 1)`` buckets, so the relative error is bounded and the bucket count is fixed
+    no matter how many values are recorded.
+    """
+
+    def __init__(self, highest: int = 60_000_000, sub_bucket_bits: int = 8) -> None:
+        self.highest = highest
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.half_count = self.sub_bucket_count >> 1
+        self.counts = [0] * (self._index(highest) + 1)
+        self.total = 0
+        self.min = math.inf
+        self.max = 0
+        self.sum = 0
+
+    def _index(self, value: int) -> int:
+        if value < self.sub_bucket_count:
+            return value
+
+        shift = value.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + (shift - 1) * self.half_count + (value >> shift) - self.half_count
+
+    def _highest_equivalent(self, index: int) -> int:
+        if index < self.sub_bucket_count:
+            return index
+
+        shift, offset = divmod(index - self.sub_bucket_count, self.half_count)
+        shift += 1
+        return ((offset + self.half_count + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        value = min(max(int(value), 0), self.highest)
+        self.counts[self._index(value)] += 1
+        self.total += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, percentile: float) -> int:
+        if self.total == 0:
+            return 0
+
+        target = max(1, math.ceil(self.total * percentile / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max)
+
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else 0
+
+
+@dataclass
+class LoadStats:
+    histogram: Histogram = field(default_factory=Histogram)
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    started: float = field(default_factory=time.perf_counter)
+    finished: float | None = None
+
+    @property
+    def requests(self) -> int:
+        return self.histogram.total
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+    def report(self) -> dict[str, Any]:
+        def ms(us: float) -> float:
+            return round(us / 1000, 3)
+
+        histogram = self.histogram
+        return {
+            "requests": self.requests,
+            "duration_s": round(self.elapsed, 3),
+            "throughput_rps": round(self.requests / self.elapsed, 2) if self.elapsed else 0,
+            "latency_ms": {
+                "min": ms(histogram.min if histogram.total else 0),
+                "mean": ms(histogram.mean),
+                "p50": ms(histogram.percentile(50)),
+                "p90": ms(histogram.percentile(90)),
+                "p99": ms(histogram.percentile(99)),
+                "max": ms(histogram.max),
+            },
+            "statuses": dict(sorted(self.statuses.items())),
+            "errors": dict(self.errors),
+        }
+
+
+async def run_load(
+    sessions: SessionManager,
+    url: URL,
+    plugins: PluginManager | None = None,
+    concurrency: int = 10,
+    rps: float | None = None,
+    duration: float | None = None,
+    requests: int | None = None,
+    on_progress: Callable[[LoadStats], Any] | None = None,
+    progress_interval: float = 0.5,
+) -> LoadStats:
+    """Drive a URL until ``duration`` seconds pass or ``requests`` calls are made, every one of them past the
+    response cache."""
+    plugins = plugins or PluginManager.instance()
+    stats = LoadStats()
+    deadline = stats.started + duration if duration else math.inf
+    method = url.method
+    rendered = str(url)
+    request_data = {f: url[f] for f in url.fields if f in url}
+    sent = 0
+
+    def claim() -> bool:
+        nonlocal sent
+        if (requests and sent >= requests) or time.perf_counter() >= deadline:
+            return False
+        sent += 1
+        return True
+
+    async def call() -> None:
+        start = time.perf_counter()
+        try:
+            async with sessions.request(
+                method, rendered, data=request_data, use_cache=False, **request_options(plugins)
+            ) as response:
+                await response.read()
+                stats.statuses[response.status] += 1
+        except Exception as e:
+            stats.errors[type(e).__name__] += 1
+        stats.histogram.record((time.perf_counter() - start) * 1_000_000)
+
+    async def worker(pace: float | None) -> None:
+        next_at = time.perf_counter()
+        while claim():
+            if pace is not None:
+                next_at += pace
+                await call()
+                if (delay := next_at - time.perf_counter()) > 0:
+                    await asyncio.sleep(delay)
+            else:
+                await call()
+
+    async def progress() -> None:
+        while on_progress is not None:
+            await asyncio.sleep(progress_interval)
+            on_progress(stats)
+
+    if not duration and not requests:
+        requests = 100
+
+    # Each worker is paced to its share of the target rate
+    pace = concurrency / rps if rps else None
+    reporter = asyncio.create_task(progress())
+    try:
+        await asyncio.gather(*(worker(pace) for _ in range(concurrency)))
+    finally:
+        reporter.cancel()
+        stats.finished = time.perf_counter()
+
+    return stats
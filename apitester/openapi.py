@@ -0,0 +1,131 @@
+# Standard Library
+import hashlib
+import json
+import os
+import re
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+try:
+    # Third Party
+    import yaml
+except ImportError:
+    yaml = None
+
+# First Party
+from apitester import __name__ as project_name
+from apitester.response import loads
+from apitester.url import URL
+
+CACHE_VERSION = 2
+METHODS = ("get", "post", "put", "patch", "delete", "head", "options")
+FORM_TYPES = ("application/x-www-form-urlencoded", "multipart/form-data", "application/json")
+
+_not_identifier = re.compile(r"\W+")
+
+
+def _cache_path(digest: str) -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / project_name / "openapi" / f"{digest}.json"
+
+
+def _identifier(name: str) -> str:
+    name = _not_identifier.sub("_", name).strip("_") or "param"
+    return f"_{name}" if name[0].isdigit() else name
+
+
+def parse(content: bytes, path: str = "") -> dict[str, Any]:
+    """The spec document, YAML needs PyYAML installed."""
+    if path.endswith((".yaml", ".yml")):
+        if yaml is None:
+            raise ValueError(f"Install PyYAML to read {path}")
+        try:
+            return yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        except yaml.YAMLError as e:
+            raise ValueError(f"{path}: {e}") from e
+    return loads(content)
+
+
+class _Resolver:
+    def __init__(self, spec: dict[str, Any]) -> None:
+        self.spec = spec
+
+    def __call__(self, value: Any) -> Any:
+        # Only local references are followed, anything else is left as it is
+        seen = set()
+        while isinstance(value, dict) and isinstance(ref := value.get("$ref"), str) and ref.startswith("#/"):
+            if ref in seen:
+                return {}
+            seen.add(ref)
+            value = self.spec
+            for part in ref[2:].split("/"):
+                value = value.get(part.replace("~1", "/").replace("~0", "~"), {}) if isinstance(value, dict) else {}
+        return value
+
+
+def catalog(spec: dict[str, Any]) -> dict[str, dict[str, dict[str, Any]]]:
+    """Every operation as ``{tag: {name: {url, method, fields}}}``, ready to become URLs."""
+    resolve = _Resolver(spec)
+    servers = spec.get("servers") or [{}]
+    base = urlsplit(servers[0].get("url", "")).path.rstrip("/")
+
+    result: dict[str, dict[str, dict[str, Any]]] = {}
+    for path, item in (spec.get("paths") or {}).items():
+        item = resolve(item)
+        shared = item.get("parameters", [])
+
+        for method in METHODS:
+            if not isinstance(operation := item.get(method), dict):
+                continue
+
+            template = base + path
+            query = []
+            for parameter in map(resolve, [*shared, *operation.get("parameters", [])]):
+                name = parameter.get("name", "")
+                variable = _identifier(name)
+                match parameter.get("in"):
+                    case "path":
+                        template = template.replace(f"{{{name}}}", f"{{{{ {variable} }}}}")
+                    case "query" if parameter.get("required"):
+                        query.append(f"{name}={{{{ {variable} }}}}")
+            if query:
+                template += ("&" if "?" in template else "?") + "&".join(query)
+
+            fields: list[str] = []
+            content = resolve(operation.get("requestBody", {})).get("content", {})
+            for media_type in FORM_TYPES:
+                if media_type in content:
+                    schema = resolve(content[media_type].get("schema", {}))
+                    fields = list(schema.get("properties", {}))
+                    break
+
+            tag = _identifier((operation.get("tags") or ["default"])[0])
+            name = _identifier(operation.get("operationId") or f"{method}_{path}")
+            group = result.setdefault(tag, {})
+            while name in group:
+                name = f"{name}_{method}"
+            group[name] = {"url": template, "method": method.upper(), "fields": fields}
+
+    return result
+
+
+def load(path: str) -> dict[str, dict[str, URL]]:
+    """The URLs described by a spec, parsed once per version of the file and cached by its hash."""
+    content = Path(path).read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+    cache = _cache_path(digest)
+
+    entries = None
+    with suppress(OSError, ValueError, KeyError):
+        cached = loads(cache.read_bytes())
+        if cached["version"] == CACHE_VERSION:
+            entries = cached["urls"]
+
+    if entries is None:
+        entries = catalog(parse(content, path))
+        with suppress(OSError):
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            cache.write_text(json.dumps({"version": CACHE_VERSION, "urls": entries}, separators=(",", ":")))
+
+    return {tag: {name: URL(**entry) for name, entry in group.items()} for tag, group in entries.items()}
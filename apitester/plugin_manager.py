@@ -1,6 +1,15 @@
 # Standard Library
-from collections import ChainMap
+import hashlib
+import importlib
+import json
+import os
+import site
+import sys
+import time
 from collections.abc import Iterable
+from contextlib import suppress
+from importlib.metadata import EntryPoint, entry_points
+from pathlib import Path
 from typing import Any
 
 # Third Party
@@ -8,39 +17,175 @@ import pluggy
 
 # First Party
 from apitester import __name__ as project_name
-from apitester.specs import RequestSpec
+from apitester.profiling import profile
+from apitester.specs import CACHE_TTL_ATTR, RequestSpec
 
-# Locals
-from . import plugins
+_MISSING = object()
+
+
+def _cache_path() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / project_name / "plugins.json"
+
+
+def _environment_key() -> str:
+    """Changes whenever a distribution is installed or removed."""
+    site_dirs = set(site.getsitepackages()) | {site.getusersitepackages()}
+    site_dirs |= {p for p in sys.path if p.endswith(("site-packages", "dist-packages"))}
+
+    parts = [sys.prefix, sys.version]
+    for site_dir in sorted(site_dirs):
+        with suppress(OSError):
+            parts.append(f"{site_dir}:{os.stat(site_dir).st_mtime_ns}")
+
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def discover_entrypoints() -> list[tuple[str, str]]:
+    """Installed plugin entry points as (name, value), cached per environment."""
+    path = _cache_path()
+    key = _environment_key()
+
+    with suppress(OSError, ValueError, KeyError):
+        cached = json.loads(path.read_text())
+        if cached["key"] == key:
+            return [tuple(ep) for ep in cached["entrypoints"]]
+
+    found = [(ep.name, ep.value) for ep in entry_points(group=project_name)]
+
+    with suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"key": key, "entrypoints": found}))
+        os.replace(tmp, path)
+
+    return found
+
+
+class _HookCache:
+    """Flattened results of a dict returning hook.
+
+    Results of cached implementations are kept until they expire, implementations without a cache
+    declaration are called every time. When a wrapper or ``firstresult`` has a say in the result the hook
+    is called through pluggy, and what it returns is only kept if every implementation is cached.
+    """
+
+    def __init__(self, hook) -> None:
+        self.hook = hook
+        self.firstresult = hook.spec is not None and hook.spec.opts.get("firstresult", False)
+        impls = hook.get_hookimpls()
+        self.plain = not self.firstresult and not any(impl.hookwrapper or impl.wrapper for impl in impls)
+        # pluggy calls the last registered implementation first, and the first result wins
+        self.impls = [(impl, getattr(impl.function, CACHE_TTL_ATTR, _MISSING)) for impl in reversed(impls)]
+        self.dynamic = any(ttl is _MISSING for _, ttl in self.impls)
+        self.results: dict[int, tuple[float, dict[str, str]]] = {}
+        self.merged: dict[str, str] = {}
+        self.expires = -1.0
+
+    def _result(self, index: int, impl, ttl: Any, now: float) -> dict[str, str]:
+        if ttl is _MISSING:
+            return impl.function() or {}
+
+        if (cached := self.results.get(index)) is None or cached[0] <= now:
+            expires = now + ttl if ttl is not None else float("inf")
+            cached = self.results[index] = (expires, impl.function() or {})
+
+        return cached[1]
+
+    def _called(self, now: float) -> dict[str, str]:
+        results = self.hook()
+        merged: dict[str, str] = {}
+        for result in reversed([results] if self.firstresult else results):
+            merged.update(result or {})
+
+        ttls = [float("inf") if ttl is None else ttl for _, ttl in self.impls if ttl is not _MISSING]
+        self.expires = now + min(ttls, default=float("inf"))
+        return merged
+
+    def get(self) -> dict[str, str]:
+        now = time.monotonic()
+        if not self.dynamic and now < self.expires:
+            return self.merged
+
+        if not self.plain:
+            self.merged = self._called(now)
+            return self.merged
+
+        merged: dict[str, str] = {}
+        for index, (impl, ttl) in reversed(list(enumerate(self.impls))):
+            merged.update(self._result(index, impl, ttl, now))
+
+        self.merged = merged
+        self.expires = min((expires for expires, _ in self.results.values()), default=float("inf"))
+        return merged
 
 
 class PluginManager:
     log: Any
+    _instance: "PluginManager | None" = None
 
     def __init__(self, log=None) -> None:
         self.log = log or print
-        self._plugin_manager = self._get_plugin_manager()
+        self._pm: pluggy.PluginManager | None = None
+        self._hook_caches: dict[str, _HookCache] = {}
+
+    @classmethod
+    def instance(cls, log=None) -> "PluginManager":
+        """The process wide plugin manager."""
+        if cls._instance is None:
+            cls._instance = cls(log)
+        elif log is not None:
+            cls._instance.log = log
+        return cls._instance
+
+    @property
+    def _plugin_manager(self) -> pluggy.PluginManager:
+        # Plugins are only discovered and imported once a hook is first needed
+        if self._pm is None:
+            self._pm = self._get_plugin_manager()
+        return self._pm
 
     def _get_plugin_manager(self):
         pm = pluggy.PluginManager(project_name)
         pm.add_hookspecs(RequestSpec)
-        for plugin in plugins.__all__:
-            __import__(f"apitester.plugins.{plugin}")
-            _class = getattr(plugins, plugin)
-            pm.register(_class(), plugin)
-        pm.load_setuptools_entrypoints(project_name)
+
+        with profile.phase("plugin discovery"):
+            # First Party
+            from apitester import plugins
+
+            found = discover_entrypoints()
+
+        with profile.phase("plugin import"):
+            for plugin in plugins.__all__:
+                module = importlib.import_module(f"apitester.plugins.{plugin}")
+                pm.register(getattr(module, plugin)(), plugin)
+
+            for name, value in found:
+                if pm.get_plugin(name) or pm.is_blocked(name):
+                    continue
+                pm.register(EntryPoint(name, value, project_name).load(), name)
 
         return pm
 
+    def register(self, plugin, name: str | None = None) -> str | None:
+        self._hook_caches.clear()
+        return self._plugin_manager.register(plugin, name)
+
+    def unregister(self, plugin=None, name: str | None = None) -> Any:
+        self._hook_caches.clear()
+        return self._plugin_manager.unregister(plugin, name)
+
+    def _call(self, hook_name: str) -> dict[str, str]:
+        if (cache := self._hook_caches.get(hook_name)) is None:
+            cache = self._hook_caches[hook_name] = _HookCache(getattr(self._plugin_manager.hook, hook_name))
+        return cache.get()
+
     @property
     def active_plugins(self) -> Iterable[tuple[str, str | None]]:
         for name, plugin in self._plugin_manager.list_name_plugin():
             yield (name, str(plugin.__doc__) or None)
 
-    def get_cookies(self, inital: dict[str, str] | None = None):
-        cookies = self._plugin_manager.hook.cookies()
-        return ChainMap((inital or {}), *cookies)
+    def get_cookies(self, inital: dict[str, str] | None = None) -> dict[str, str]:
+        return {**self._call("cookies"), **(inital or {})}
 
-    def get_headers(self, inital: dict[str, str] | None = None):
-        headers = self._plugin_manager.hook.headers()
-        return ChainMap((inital or {}), *headers)
+    def get_headers(self, inital: dict[str, str] | None = None) -> dict[str, str]:
+        return {**self._call("headers"), **(inital or {})}
@@ -3,6 +3,7 @@ import pluggy
 
 # First Party
 from apitester import __name__ as project_name
+from apitester.specs import cache
 
 hookimpl = pluggy.HookimplMarker(project_name)
 
@@ -11,5 +12,6 @@ class xdebug:
     """Adds the xdebug session start cookie."""
 
     @hookimpl
+    @cache()
     def cookies(self):
         return {"XDEBUG_SESSION": "start"}
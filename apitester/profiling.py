@@ -0,0 +1,34 @@
+# Standard Library
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class StartupProfile:
+    """Wall clock timings of the phases of starting up."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.phases: list[tuple[str, float]] = []
+        self.marks: list[tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def mark(self, name: str) -> None:
+        self.marks.append((name, time.perf_counter() - self.started))
+
+    def report(self) -> str:
+        width = max((len(name) for name, _ in self.phases + self.marks), default=0)
+        lines = ["Startup profile:"]
+        lines += [f"  {name:<{width}}  {duration * 1000:9.1f}ms" for name, duration in self.phases]
+        lines += [f"  {name:<{width}}  {'at':>3} {offset * 1000:.1f}ms" for name, offset in self.marks]
+        return "\n".join(lines)
+
+
+profile = StartupProfile()
@@ -0,0 +1,258 @@
+# Standard Library
+import codecs
+import json
+import mmap
+import re
+import tempfile
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, BinaryIO
+
+# First Party
+from apitester.jsonpath import stream
+
+try:
+    # Third Party
+    import orjson
+except ImportError:
+    orjson = None
+
+Buffer = bytes | bytearray | mmap.mmap
+
+_whitespace = re.compile(rb"[ \t\n\r]*+")
+_string = re.compile(rb'"(?:[^"\\]++|\\.)*+"')
+_scalar = re.compile(rb'"(?:[^"\\]++|\\.)*+"|[^,:\[\]{}\s]++')
+# Runs of strings and scalars, containers with nothing nested in them, or a single bracket
+_token = re.compile(
+    rb'(?:"(?:[^"\\]++|\\.)*+"|[^\[\]{}"]++)++'
+    rb'|\{(?:[^\[\]{}"]++|"(?:[^"\\]++|\\.)*+")*+\}'
+    rb'|\[(?:[^\[\]{}"]++|"(?:[^"\\]++|\\.)*+")*+\]'
+    rb"|[\[\]{}]"
+)
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    """Decode JSON with orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _skip(data: Buffer, index: int) -> int:
+    return match.end() if (match := _whitespace.match(data, index)) else index
+
+
+def _end(data: Buffer, index: int) -> int:
+    """Where the container starting at ``index`` ends, found without decoding any of it."""
+    depth = 0
+    for match in _token.finditer(data, index):
+        start, end = match.span()
+        if data[start] in b"[{":
+            if end - start > 1:
+                # A whole container with nothing nested in it
+                if depth == 0:
+                    return end
+                continue
+            depth += 1
+        elif data[start] in b"]}":
+            depth -= 1
+            if depth == 0:
+                return end
+
+    raise ValueError(f"Unterminated JSON container starting at byte {index}")
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class RawJSON:
+    """A JSON value left undecoded, as a span of the body it came from."""
+
+    data: Buffer
+    start: int
+    end: int
+
+    def decode(self) -> Any:
+        return loads(self.data[self.start : self.end])
+
+
+def loads_lazy(data: Buffer | str, depth: int = 3) -> Any:
+    """Decode the outer ``depth`` levels of a JSON document.
+
+    Anything deeper is left as a RawJSON pointing into ``data``, to be decoded when it is needed. Only
+    where each deeper value ends is looked for, so neither it nor a str copy of the document is ever
+    built, and a body spilled to disk is only paged in as it is scanned.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+
+    value, end = _parse(data, _skip(data, 0), depth)
+    if _skip(data, end) != len(data):
+        raise ValueError(f"Extra data at byte {end}")
+    return value
+
+
+def _parse(data: Buffer, index: int, depth: int) -> tuple[Any, int]:
+    opening = data[index : index + 1]
+    if opening not in (b"{", b"["):
+        if not (match := _scalar.match(data, index)):
+            raise ValueError(f"Expecting value at byte {index}")
+        return loads(match.group()), match.end()
+    if depth <= 0:
+        end = _end(data, index)
+        return RawJSON(data, index, end), end
+
+    is_object = opening == b"{"
+    closing = b"}" if is_object else b"]"
+    result: Any = {} if is_object else []
+
+    index = _skip(data, index + 1)
+    if data[index : index + 1] == closing:
+        return result, index + 1
+
+    while True:
+        if is_object:
+            if not (match := _string.match(data, index)):
+                raise ValueError(f"Expecting property name enclosed in double quotes at byte {index}")
+            key = loads(match.group())
+            index = _skip(data, match.end())
+            if data[index : index + 1] != b":":
+                raise ValueError(f"Expecting ':' delimiter at byte {index}")
+            index = _skip(data, index + 1)
+            result[key], index = _parse(data, index, depth - 1)
+        else:
+            value, index = _parse(data, index, depth - 1)
+            result.append(value)
+
+        index = _skip(data, index)
+        match data[index : index + 1]:
+            case b",":
+                index = _skip(data, index + 1)
+            case c if c == closing:
+                return result, index + 1
+            case _:
+                raise ValueError(f"Expecting ',' delimiter at byte {index}")
+
+
+class ResponseBody:
+    """A response body held in memory up to ``max_memory`` bytes, past that it
+    is spilled to a memory mapped temporary file."""
+
+    def __init__(self, max_memory: int = 8 * 1024 * 1024, content_type: str = "", charset: str | None = None) -> None:
+        self.max_memory = max_memory
+        self.content_type = content_type
+        self.charset = charset or "utf-8"
+        self.size = 0
+        self._buffer = bytearray()
+        self._file: BinaryIO | None = None
+        self._mmap: mmap.mmap | None = None
+
+    @classmethod
+    async def read(
+        cls,
+        response,
+        max_memory: int = 8 * 1024 * 1024,
+        chunk_size: int = 64 * 1024,
+        on_chunk: Callable[[int], Any] | None = None,
+    ) -> "ResponseBody":
+        body = cls(max_memory, response.content_type, response.charset)
+        async for chunk in response.content.iter_chunked(chunk_size):
+            body.write(chunk)
+            if on_chunk is not None:
+                on_chunk(body.size)
+        body.finish()
+
+        return body
+
+    @property
+    def spilled(self) -> bool:
+        return self._file is not None
+
+    @property
+    def is_json(self) -> bool:
+        return "json" in self.content_type
+
+    @property
+    def data(self) -> bytes | bytearray | mmap.mmap:
+        if self._mmap is not None:
+            return self._mmap
+        return b"" if self.spilled else self._buffer
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+
+        if self._file is None and self.size > self.max_memory:
+            self._file = tempfile.TemporaryFile()
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._buffer += chunk
+
+    def finish(self) -> None:
+        if self._file is not None and self.size:
+            self._file.flush()
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def decodes_lazily(self, lazy_over: int | None) -> bool:
+        return lazy_over is not None and self.size > lazy_over
+
+    def json(self, lazy_over: int | None = None) -> Any:
+        """The decoded body, bodies over ``lazy_over`` bytes are decoded with
+        loads_lazy and so need the body kept open until they are done with."""
+        if self.decodes_lazily(lazy_over):
+            return loads_lazy(self.data)
+        return loads(self.data[:] if self._mmap is not None else self.data)
+
+    def text(self, chunk_size: int = 1024 * 1024) -> str:
+        decoder = codecs.getincrementaldecoder(self.charset)(errors="replace")
+        data = memoryview(self.data)
+        try:
+            parts = [decoder.decode(data[i : i + chunk_size]) for i in range(0, len(data), chunk_size)]
+        finally:
+            data.release()
+        return "".join(parts) + decoder.decode(b"", final=True)
+
+    def select(self, selector: str, chunk_size: int = 1024 * 1024) -> Iterator[Any]:
+        """Matches of a selector, streamed so not even a spilled body is decoded all at once."""
+        data = self.data
+        return stream(selector, (bytes(data[i : i + chunk_size]) for i in range(0, self.size, chunk_size)))
+
+    def lines(self) -> "BodyLines":
+        return BodyLines(self)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+        self._buffer = bytearray()
+
+
+class BodyLines(Sequence[str]):
+    """Lines of a body, decoded one at a time from an index of line offsets."""
+
+    def __init__(self, body: ResponseBody) -> None:
+        self.body = body
+        data = body.data
+        self._offsets = array("Q", [0])
+
+        position = data.find(b"\n")
+        while position != -1:
+            self._offsets.append(position + 1)
+            position = data.find(b"\n", position + 1)
+
+        if self._offsets[-1] != len(data):
+            self._offsets.append(len(data) + 1)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        start, end = self._offsets[index], self._offsets[index + 1] - 1
+        return self.body.data[start:end].decode(self.body.charset, errors="replace").rstrip("\r")
@@ -0,0 +1,127 @@
+# Standard Library
+import asyncio
+import json
+import time
+import tomllib
+from collections.abc import AsyncIterator, Iterable
+from pathlib import Path
+from typing import Any
+
+# First Party
+from apitester.cache import CacheStatus
+from apitester.config import config
+from apitester.load import run_load
+from apitester.plugin_manager import PluginManager
+from apitester.session import SessionManager, request_options
+from apitester.tracing import RequestTiming
+from apitester.url import URL
+
+
+def load_variables(path: str | None = None, pairs: Iterable[str] = ()) -> dict[str, str]:
+    variables: dict[str, str] = {}
+
+    if path is not None:
+        with open(path, "rb") as f:
+            loaded = tomllib.load(f) if Path(path).suffix == ".toml" else json.load(f)
+        variables.update({k: str(v) for k, v in loaded.items()})
+
+    for pair in pairs:
+        name, _, value = pair.partition("=")
+        variables[name.strip()] = value
+
+    return variables
+
+
+def bind(url: URL, variables: dict[str, str]) -> None:
+    for variable in url.variables():
+        if variable in variables:
+            url[variable] = variables[variable]
+
+
+async def execute(
+    sessions: SessionManager, name: str, url: URL, options: dict[str, Any], values: dict[str, str] | None = None
+) -> dict[str, Any]:
+    """Call ``url`` once, with ``values`` overriding the variables bound to it."""
+    values = {v: url[v] for v in url.variables() if v in url} | (values or {})
+    result: dict[str, Any] = {"endpoint": name, "method": url.method, "url": url.resolve(values)}
+    request_data = {f: values[f] for f in url.fields if f in values}
+
+    start = time.perf_counter()
+    timing = RequestTiming()
+    cache = CacheStatus()
+    try:
+        async with sessions.request(
+            url.method, result["url"], data=request_data, timing=timing, cache=cache, **options
+        ) as response:
+            result["status"] = response.status
+            if "json" in response.content_type:
+                result["body"] = await response.json()
+            else:
+                result["body"] = await response.text()
+    except Exception as e:
+        result["error"] = type(e).__name__
+        result["message"] = str(e)
+
+    timing.finish()
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    result["timing"] = timing.as_dict()
+    if sessions.cache is not None:
+        result["cache"] = cache.as_dict()
+    return result
+
+
+def select(paths: Iterable[str]) -> dict[str, URL]:
+    config.load_openapi()
+
+    urls: dict[str, URL] = {}
+    for path in paths:
+        urls.update(config.select(path))
+
+    return urls
+
+
+async def run(urls: dict[str, URL], variables: dict[str, str], concurrency: int = 4) -> AsyncIterator[dict[str, Any]]:
+    plugins = PluginManager.instance()
+    sessions = SessionManager(config.session)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(name: str, url: URL) -> dict[str, Any]:
+        async with semaphore:
+            return await execute(sessions, name, url, request_options(plugins))
+
+    for url in urls.values():
+        bind(url, variables)
+
+    try:
+        for task in asyncio.as_completed([bounded(name, url) for name, url in urls.items()]):
+            yield await task
+    finally:
+        await sessions.close()
+
+
+async def run_to_stream(urls: dict[str, URL], variables: dict[str, str], concurrency: int, out) -> bool:
+    ok = True
+    async for result in run(urls, variables, concurrency):
+        ok = ok and "error" not in result and result["status"] < 400
+        out.write(json.dumps(result, default=str) + "\n")
+        out.flush()
+
+    return ok
+
+
+async def load_test(
+    url: URL,
+    variables: dict[str, str],
+    concurrency: int = 10,
+    rps: float | None = None,
+    duration: float | None = None,
+    requests: int | None = None,
+) -> dict[str, Any]:
+    bind(url, variables)
+    sessions = SessionManager(config.session)
+    try:
+        stats = await run_load(sessions, url, PluginManager.instance(), concurrency, rps, duration, requests)
+    finally:
+        await sessions.close()
+
+    return stats.report()
@@ -0,0 +1,170 @@
+# Standard Library
+import bisect
+import heapq
+import threading
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+
+# First Party
+from apitester.config import ConfigDiff, iter_urls, URLConf
+from apitester.url import URL
+
+
+def trigrams(text: str) -> set[str]:
+    """Trigrams of ``text``, padded so short words and the starts of words have their own."""
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    path: str
+    url: URL
+    exact: bool
+
+
+class _Postings(dict[str, set[int]]):
+    def add(self, id: int, text: str) -> None:
+        for trigram in trigrams(text):
+            self.setdefault(trigram, set()).add(id)
+
+    def discard(self, id: int, text: str) -> None:
+        for trigram in trigrams(text):
+            if (ids := self.get(trigram)) is not None:
+                ids.discard(id)
+                if not ids:
+                    del self[trigram]
+
+    def containing(self, query: str) -> set[int]:
+        """Ids whose text could contain ``query``, still to be checked."""
+        if len(query) < 3:
+            # Too short for a whole trigram, so take anything with a word starting with it
+            prefix = f" {query}"
+            return set().union(*(ids for trigram, ids in self.items() if trigram.startswith(prefix)))
+
+        grams = sorted((query[i : i + 3] for i in range(len(query) - 2)), key=lambda trigram: len(self.get(trigram, ())))
+        if not (result := self.get(grams[0])):
+            return set()
+        return result.intersection(*(self.get(trigram, ()) for trigram in grams[1:]))
+
+
+class SearchIndex:
+    """Trigram index over every url's tree path, template and method.
+
+    Results are urls whose name contains the query, then anything else containing it, then fuzzy
+    matches sharing most of the query's trigrams, each group shortest path first. Candidates come from
+    set intersections over the postings, and large groups are read off the paths in length order until
+    there are enough, so a lookup stays within a few milliseconds however large the catalog.
+    """
+
+    fuzzy_budget = 8192
+
+    def __init__(self, urls: URLConf | None = None) -> None:
+        self._lock = threading.RLock()
+        self._ids: dict[str, int] = {}
+        self._docs: dict[int, tuple[str, URL, str, str]] = {}
+        self._order: list[tuple[int, str]] = []
+        self._next_id = 0
+        self._names = _Postings()
+        self._texts = _Postings()
+
+        if urls is not None:
+            for path, url in iter_urls(urls):
+                self._add(path, url, sort=False)
+            self._order.sort()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, path: str, url: URL) -> None:
+        with self._lock:
+            self._add(path, url)
+
+    def _add(self, path: str, url: URL, sort: bool = True) -> None:
+        if path in self._ids:
+            self.remove(path)
+
+        id, self._next_id = self._next_id, self._next_id + 1
+        name, text = path.rpartition(".")[2].lower(), f"{path} {url.url} {url.method}".lower()
+        self._ids[path] = id
+        self._docs[id] = (path, url, name, text)
+        self._names.add(id, name)
+        self._texts.add(id, text)
+
+        if sort:
+            bisect.insort(self._order, (len(path), path))
+        else:
+            self._order.append((len(path), path))
+
+    def remove(self, path: str) -> None:
+        with self._lock:
+            if (id := self._ids.pop(path, None)) is None:
+                return
+
+            _, _, name, text = self._docs.pop(id)
+            self._names.discard(id, name)
+            self._texts.discard(id, text)
+            del self._order[bisect.bisect_left(self._order, (len(path), path))]
+
+    def update(self, diff: ConfigDiff) -> None:
+        with self._lock:
+            for path in diff.removed:
+                self.remove(path)
+            for path, url in (diff.changed | diff.added).items():
+                self._add(path, url)
+
+    def _shortest(self, ids: set[int], accept: Callable[[int], bool], limit: int) -> list[int]:
+        if not ids or limit <= 0:
+            return []
+
+        if len(ids) * 16 < len(self._order):
+            return heapq.nsmallest(
+                limit, (id for id in ids if accept(id)), key=lambda id: (len(self._docs[id][0]), self._docs[id][0])
+            )
+
+        found = []
+        for _, path in self._order:
+            if (id := self._ids[path]) in ids and accept(id):
+                found.append(id)
+                if len(found) == limit:
+                    break
+        return found
+
+    def _fuzzy(self, query: str, exclude: set[int], limit: int) -> list[int]:
+        grams = sorted(
+            (g for g in {query[i : i + 3] for i in range(len(query) - 2)} if g in self._texts),
+            key=lambda trigram: len(self._texts[trigram]),
+        )
+
+        # Count over the rarest trigrams only, they say the most about a match and bound the work on big catalogs
+        used, budget = 0, self.fuzzy_budget
+        counts: Counter[int] = Counter()
+        for trigram in grams:
+            if used and len(self._texts[trigram]) > budget:
+                break
+            counts.update(self._texts[trigram])
+            budget -= len(self._texts[trigram])
+            used += 1
+
+        needed = max((len(query) - 2) / 2 * used / max(len(grams), 1), 1)
+        matches = [id for id, count in counts.items() if count >= needed and id not in exclude]
+        return heapq.nsmallest(limit, matches, key=lambda id: (-counts[id], len(self._docs[id][0])))
+
+    def search(self, query: str, limit: int = 20) -> list[SearchResult]:
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        with self._lock:
+            names = self._shortest(self._names.containing(query), lambda id: query in self._docs[id][2], limit)
+            seen = set(names)
+            texts = self._shortest(
+                self._texts.containing(query), lambda id: id not in seen and query in self._docs[id][3], limit - len(names)
+            )
+            seen.update(texts)
+            fuzzy = self._fuzzy(query, seen, limit - len(seen)) if len(seen) < limit and len(query) > 3 else []
+
+            return [SearchResult(*self._docs[id][:2], exact=True) for id in names + texts] + [
+                SearchResult(*self._docs[id][:2], exact=False) for id in fuzzy
+            ]
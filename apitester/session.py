@@ -0,0 +1,145 @@
+# Standard Library
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import Any, TYPE_CHECKING
+from urllib.parse import urljoin
+
+# First Party
+from apitester.auth import auth
+from apitester.cache import CachedResponse, CacheStatus, HTTPCache, SAFE_METHODS
+from apitester.config import BearerAuthConf, config, SessionConf
+from apitester.tokens import TokenManager
+from apitester.tracing import RequestTiming, timing_trace_config
+
+if TYPE_CHECKING:
+    # Third Party
+    import aiohttp
+    from aiohttp import BasicAuth
+
+
+def request_options(plugins) -> dict[str, Any]:
+    """Headers, cookies and auth to overlay on a single request."""
+    headers = dict(plugins.get_headers({"accept": "application/json"}))
+    cookies = dict(plugins.get_cookies())
+
+    basic_auth = None
+
+    with suppress(KeyError):
+        match config.auth.type:
+            case "header":
+                headers[getattr(config.auth, "key")] = auth["api_key"]
+            case "basic":
+                # Third Party
+                from aiohttp import BasicAuth
+
+                basic_auth = BasicAuth((auth.username or "").strip(), (auth.password or "").strip())
+
+    return {"headers": headers, "cookies": cookies, "auth": basic_auth}
+
+
+class SessionManager:
+    """App wide pooled session, reusing keep-alive connections between requests."""
+
+    conf: SessionConf
+    tokens: TokenManager | None
+    cache: HTTPCache | None
+
+    def __init__(self, conf: SessionConf | None = None) -> None:
+        self.conf = conf or SessionConf()
+        self.tokens = TokenManager(config.auth) if isinstance(config.auth, BearerAuthConf) else None
+        self.cache = HTTPCache(config.cache) if config.cache.enabled else None
+        self._session: "aiohttp.ClientSession | None" = None
+
+    def reconfigure(self) -> None:
+        """Follow the auth and cache settings after the config is reloaded, keeping the token and cache if they still apply."""
+        if not isinstance(config.auth, BearerAuthConf):
+            self.tokens = None
+        elif self.tokens is None or self.tokens.conf != config.auth:
+            self.tokens = TokenManager(config.auth)
+        else:
+            # The new conf's login url renders against the reloaded urls
+            self.tokens.conf = config.auth
+
+        if self.cache is not None and self.cache.conf != config.cache:
+            self.cache.close()
+            self.cache = None
+        if self.cache is None and config.cache.enabled:
+            self.cache = HTTPCache(config.cache)
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            # Third Party
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=self.conf.limit,
+                limit_per_host=self.conf.limit_per_host,
+                ttl_dns_cache=self.conf.ttl_dns_cache,
+                keepalive_timeout=self.conf.keepalive_timeout,
+            )
+            # Cookies are overlaid per request, so nothing should leak between calls
+            self._session = aiohttp.ClientSession(
+                connector=connector, cookie_jar=aiohttp.DummyCookieJar(), trace_configs=[timing_trace_config()]
+            )
+
+        return self._session
+
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        cookies: dict[str, str] | None = None,
+        auth: "BasicAuth | None" = None,
+        timing: RequestTiming | None = None,
+        cache: CacheStatus | None = None,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> AsyncIterator["aiohttp.ClientResponse | CachedResponse"]:
+        """Pass a RequestTiming as ``timing`` to have it filled in as the request progresses, and a CacheStatus
+        as ``cache`` to find out whether the response came from the cache.
+
+        With bearer auth the current token is added, and a request rejected with a 401 is retried once with a new one.
+        """
+        method = method.upper()
+        headers = dict(headers or {})
+        token = None
+        if self.tokens is not None and "Authorization" not in headers and (token := await self.tokens.token(self)):
+            headers["Authorization"] = f"Bearer {token}"
+
+        async def send(conditional: dict[str, str]) -> "aiohttp.ClientResponse":
+            options = {"cookies": cookies, "auth": auth, "trace_request_ctx": timing, **kwargs}
+            response = await self.session.request(method, url, headers=headers | conditional, **options)
+            if response.status == 401 and token is not None and self.tokens is not None:
+                if (fresh := await self.tokens.invalidate(self, token)) is not None and fresh != token:
+                    response.release()
+                    headers["Authorization"] = f"Bearer {fresh}"
+                    response = await self.session.request(method, url, headers=headers | conditional, **options)
+
+            return response
+
+        if self.cache is not None and use_cache and method == "GET":
+            async with self.cache.fetch(url, headers, send, cache) as cached:
+                yield cached
+            return
+
+        response = await send({})
+        try:
+            if self.cache is not None and method not in SAFE_METHODS and response.status < 400:
+                # Changing a resource makes whatever was stored for it out of date (RFC 9111 4.4)
+                moved = [response.headers[name] for name in ("Location", "Content-Location") if name in response.headers]
+                await asyncio.to_thread(self.cache.invalidate, url, *(urljoin(url, location) for location in moved))
+
+            yield response
+        finally:
+            response.release()
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self.cache is not None:
+            self.cache.close()
@@ -6,6 +6,18 @@ from apitester import __name__ as project_name
 
 hookspec = pluggy.HookspecMarker(project_name)
 
+CACHE_TTL_ATTR = f"{project_name}_cache_ttl"
+
+
+def cache(ttl: float | None = None):
+    """Reuse a hook implementation's result, forever or for ``ttl`` seconds."""
+
+    def decorator(func):
+        setattr(func, CACHE_TTL_ATTR, ttl)
+        return func
+
+    return decorator
+
 
 class RequestSpec:
     @hookspec
@@ -0,0 +1,151 @@
+# Standard Library
+import asyncio
+import base64
+import json
+import time
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+# First Party
+from apitester.auth import auth
+from apitester.config import BearerAuthConf
+from apitester.utils import extract
+
+if TYPE_CHECKING:
+    # First Party
+    from apitester.session import SessionManager
+
+
+class TokenError(Exception):
+    pass
+
+
+@dataclass
+class Token:
+    value: str
+    expires_at: float | None = None
+
+    def expires_within(self, seconds: float) -> bool:
+        return self.expires_at is not None and self.expires_at - time.time() <= seconds
+
+
+def jwt_expiry(token: str) -> float | None:
+    """The ``exp`` claim of a JWT, the signature isn't checked as it is only used to know when to refresh."""
+    with suppress(ValueError, IndexError, AttributeError):
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        if isinstance(exp := claims.get("exp"), int | float):
+            return float(exp)
+
+    return None
+
+
+class TokenManager:
+    """Bearer tokens for a ``BearerAuthConf``, kept in the keyring between runs and refreshed before they expire.
+
+    However many requests need a new token at the same time, one login request is made and they all share its result.
+    """
+
+    conf: BearerAuthConf
+
+    def __init__(self, conf: BearerAuthConf) -> None:
+        self.conf = conf
+        self._token: Token | None = None
+        self._restored = False
+        self._restoring: asyncio.Task[Token | None] | None = None
+        self._credentials: tuple[str, str] | None = None
+        self._remember = True
+        self._refreshing: asyncio.Task[Token | None] | None = None
+
+    async def token(self, sessions: "SessionManager") -> str | None:
+        """A token that is good for now, logging in first if there isn't one or it has expired."""
+        if not self._restored:
+            restored = await self._restore_once()
+            # Only the first caller back uses it, and neither a login nor a token fetched meanwhile is replaced
+            if not self._restored:
+                self._restored = True
+                self._token = self._token or restored
+
+        if self._token is None or self._token.expires_within(0):
+            return await self._refresh(sessions)
+
+        if self._token.expires_within(self.conf.refresh_before):
+            # Still good, so carry on with it while the new one is fetched
+            self._start_refresh(sessions)
+
+        return self._token.value
+
+    async def invalidate(self, sessions: "SessionManager", rejected: str) -> str | None:
+        """A new token after ``rejected`` got a 401, unless another request has already replaced it."""
+        if self._token is not None and self._token.value != rejected:
+            return self._token.value
+
+        self._token = None
+        return await self._refresh(sessions)
+
+    async def login(self, sessions: "SessionManager", username: str, password: str, remember: bool = True) -> str | None:
+        self._credentials, self._remember = (username, password), remember
+        self._token, self._restored = None, True
+        if not remember:
+            await asyncio.to_thread(auth.store_token, None)
+
+        return await self._refresh(sessions)
+
+    async def _restore_once(self) -> Token | None:
+        if self._restoring is None:
+            self._restoring = asyncio.create_task(asyncio.to_thread(self._restore))
+        return await asyncio.shield(self._restoring)
+
+    def _start_refresh(self, sessions: "SessionManager") -> asyncio.Task[Token | None]:
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self._fetch(sessions))
+            # Nobody may be waiting on a background refresh, so its errors would otherwise go unretrieved
+            self._refreshing.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+        return self._refreshing
+
+    async def _refresh(self, sessions: "SessionManager") -> str | None:
+        # Shielded so one waiter being cancelled doesn't cancel the refresh for everyone else
+        token = await asyncio.shield(self._start_refresh(sessions))
+        return token.value if token is not None else None
+
+    async def _fetch(self, sessions: "SessionManager") -> Token | None:
+        if (credentials := self._credentials or await asyncio.to_thread(self._stored_credentials)) is None:
+            return None
+
+        username, password = credentials
+        async with sessions.session.post(str(self.conf.url), data={"username": username, "password": password}) as response:
+            try:
+                value = extract(await response.json(content_type=None), self.conf.token_path)
+            except (ValueError, KeyError, TypeError) as e:
+                raise TokenError(f"No token at {self.conf.token_path} in the login response ({response.status})") from e
+
+        if not isinstance(value, str):
+            raise TokenError(f"{self.conf.token_path} in the login response is not a string")
+
+        expires_at = jwt_expiry(value)
+        if expires_at is None and self.conf.expires_in is not None:
+            expires_at = time.time() + self.conf.expires_in
+
+        self._token = token = Token(value, expires_at)
+        if self._remember:
+            await asyncio.to_thread(auth.store_token, json.dumps(asdict(token)))
+
+        return token
+
+    @staticmethod
+    def _stored_credentials() -> tuple[str, str] | None:
+        if (username := auth.username) and (password := auth.password) is not None:
+            return username, password
+
+        return None
+
+    @staticmethod
+    def _restore() -> Token | None:
+        if stored := auth.load_token():
+            with suppress(ValueError, TypeError):
+                token = Token(**json.loads(stored))
+                return None if token.expires_within(0) else token
+
+        return None
@@ -0,0 +1,153 @@
+# Standard Library
+import time
+from dataclasses import dataclass, field
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Third Party
+    import aiohttp
+
+
+@dataclass
+class RequestTiming:
+    """Where the time in a single request went, all durations in seconds."""
+
+    started: float = field(default_factory=time.perf_counter)
+    dns: float | None = None
+    queued: float | None = None
+    connect: float | None = None
+    send: float | None = None
+    ttfb: float | None = None
+    download: float | None = None
+    total: float | None = None
+    reused: bool = False
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+    _marks: dict[str, float] = field(default_factory=dict, repr=False)
+
+    def mark(self, name: str) -> float:
+        self._marks[name] = now = time.perf_counter()
+        return now
+
+    def since(self, name: str) -> float | None:
+        return time.perf_counter() - self._marks[name] if name in self._marks else None
+
+    def finish(self, received: int | None = None) -> None:
+        """Called once the body has been read, with its size when it was streamed rather than read whole."""
+        if received is not None:
+            self.bytes_received = received
+        now = self.mark("finished")
+        if "response_start" in self._marks:
+            self.download = now - self._marks["response_start"]
+        self.total = now - self.started
+
+    def as_dict(self) -> dict[str, Any]:
+        def ms(value: float | None) -> float | None:
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            "dns_ms": ms(self.dns),
+            "queued_ms": ms(self.queued),
+            "connect_ms": ms(self.connect),
+            "send_ms": ms(self.send),
+            "ttfb_ms": ms(self.ttfb),
+            "download_ms": ms(self.download),
+            "total_ms": ms(self.total),
+            "reused": self.reused,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+        }
+
+
+def _timing(trace_config_ctx) -> RequestTiming | None:
+    timing = trace_config_ctx.trace_request_ctx
+    return timing if isinstance(timing, RequestTiming) else None
+
+
+async def _on_request_start(session, ctx, params) -> None:
+    if timing := _timing(ctx):
+        timing.started = timing.mark("request_start")
+
+
+async def _on_connection_queued_start(session, ctx, params) -> None:
+    if timing := _timing(ctx):
+        timing.mark("queued_start")
+
+
+async def _on_connection_queued_end(session, ctx, params) -> None:
+    if timing := _timing(ctx):
+        timing.queued = timing.since("queued_start")
+
+
+async def _on_connection_create_start(session, ctx, params) -> None:
+    if timing := _timing(ctx):
+        timing.mark("connect_start")
+
+
+async def _on_connection_create_end(session, ctx, params) -> None:
+    if (timing := _timing(ctx)) and (connect := timing.since("connect_start")) is not None:
+        # DNS resolution happens inside connection creation, and TLS is part of the connect
+        timing.connect = connect - (timing.dns or 0)
+        timing.mark("connected")
+
+
+async def _on_connection_reuseconn(session, ctx, params) -> None:
+    if timing := _timing(ctx):
+        timing.reused = True
+        timing.mark("connected")
+
+
+async def _on_dns_resolvehost_start(session, ctx, params) -> None:
+    if timing := _timing(ctx):
+        timing.mark("dns_start")
+
+
+async def _on_dns_resolvehost_end(session, ctx, params) -> None:
+    if timing := _timing(ctx):
+        timing.dns = timing.since("dns_start")
+
+
+async def _on_request_chunk_sent(session, ctx, params) -> None:
+    if timing := _timing(ctx):
+        timing.bytes_sent += len(params.chunk)
+        timing.mark("sent")
+
+
+async def _on_request_headers_sent(session, ctx, params) -> None:
+    if timing := _timing(ctx):
+        timing.mark("sent")
+
+
+async def _on_request_end(session, ctx, params) -> None:
+    if timing := _timing(ctx):
+        now = timing.mark("response_start")
+        sent = timing._marks.get("sent", now)
+        timing.send = sent - timing._marks.get("connected", timing.started)
+        timing.ttfb = now - sent
+
+
+async def _on_response_chunk_received(session, ctx, params) -> None:
+    if timing := _timing(ctx):
+        timing.bytes_received += len(params.chunk)
+
+
+def timing_trace_config() -> "aiohttp.TraceConfig":
+    """Fills in the RequestTiming passed to a request as ``trace_request_ctx``."""
+    # Third Party
+    import aiohttp
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_connection_queued_start.append(_on_connection_queued_start)
+    trace_config.on_connection_queued_end.append(_on_connection_queued_end)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_request_chunk_sent.append(_on_request_chunk_sent)
+    trace_config.on_request_headers_sent.append(_on_request_headers_sent)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_response_chunk_received.append(_on_response_chunk_received)
+    return trace_config
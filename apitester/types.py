@@ -1,4 +1,4 @@
 # Standard Library
 from typing import Literal
 
-URLMethod = Literal["GET", "POST"]
+URLMethod = Literal["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"]
@@ -1,16 +1,30 @@
 # Standard Library
 from dataclasses import dataclass, field
-from functools import lru_cache
+from functools import cache, lru_cache
+from typing import Any, TYPE_CHECKING
 from urllib.parse import urljoin
 
-# Third Party
-from jinja2 import BaseLoader, Environment, meta, select_autoescape
-
 # First Party
 from apitester import config
 from apitester.types import URLMethod
 
-env = Environment(loader=BaseLoader(), autoescape=select_autoescape())
+if TYPE_CHECKING:
+    # Third Party
+    from jinja2 import Environment, Template
+
+# Jinja's default delimiters, so plain urls never need it imported
+_MARKERS = ("{{", "{%", "{#")
+
+
+_join = lru_cache(maxsize=4096)(urljoin)
+
+
+@cache
+def environment() -> "Environment":
+    # Third Party
+    from jinja2 import BaseLoader, Environment, select_autoescape
+
+    return Environment(loader=BaseLoader(), autoescape=select_autoescape())
 
 
 @dataclass()
@@ -25,9 +39,34 @@ class URL:
     def __post_init__(self) -> None:
         self._data: dict[str, str] = {}
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "url":
+            self.__dict__.pop("_compiled", None)
+            self.__dict__.pop("_undeclared", None)
+        super().__setattr__(name, value)
+
+    @property
+    def template(self) -> "Template | None":
+        """The compiled template, or None when the url has nothing to render."""
+        try:
+            return self.__dict__["_compiled"]
+        except KeyError:
+            compiled = environment().from_string(self.url) if any(m in self.url for m in _MARKERS) else None
+            self.__dict__["_compiled"] = compiled
+            return compiled
+
+    def render(self, data: dict[str, str] | None = None) -> str:
+        if (template := self.template) is None:
+            return self.url
+
+        return template.render(self._data if data is None else data)
+
+    def resolve(self, data: dict[str, str] | None = None) -> str:
+        """The full url rendered against ``data``, leaving the url's own values alone."""
+        return _join(config.config.settings.base_url, self.render(data))
+
     def __str__(self) -> str:
-        url = env.from_string(self.url)
-        return urljoin(config.config.settings.base_url, url.render(self._data))
+        return self.resolve()
 
     def __repr__(self) -> str:
         return f"<{self.method}> - {self.url} {list(self.fields)}"
@@ -38,11 +77,63 @@ class URL:
     def __getitem__(self, name: str) -> str:
         return self._data[name]
 
-    @lru_cache
+    def __contains__(self, name: str) -> bool:
+        return name in self._data
+
     def variables(self) -> set[str]:
-        ast = env.parse(self.url)
-        return meta.find_undeclared_variables(ast) | set(self.fields)
+        if self.template is None:
+            return set(self.fields)
+
+        try:
+            undeclared = self.__dict__["_undeclared"]
+        except KeyError:
+            # Third Party
+            from jinja2 import meta
+
+            undeclared = self.__dict__["_undeclared"] = meta.find_undeclared_variables(environment().parse(self.url))
+
+        return undeclared | set(self.fields)
 
     @property
     def variable_count(self) -> int:
         return len(self.variables())
+
+
+class DeferredURL(str):
+    """A url template rendered against ``args`` on first use, and remembered
+    until invalidated."""
+
+    template: str
+    args: dict[str, Any]
+
+    def __new__(cls, template: str, args: dict[str, Any], base_url: str) -> "DeferredURL":
+        instance = super().__new__(cls)
+        instance.template = template
+        instance.args = args
+        instance._base_url = base_url
+        instance._compiled = None
+        instance._rendered = None
+        return instance
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        self._base_url = value
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        self._rendered = None
+
+    def __str__(self) -> str:
+        if self._rendered is None:
+            if self._compiled is None:
+                self._compiled = environment().from_string(self.template)
+            self._rendered = urljoin(self._base_url, self._compiled.render(self.args))
+
+        return self._rendered
+
+    def __repr__(self) -> str:
+        return f"<DeferredURL> - {self.template}"
@@ -2,19 +2,17 @@
 import functools
 from contextlib import suppress as ctx_suppress
 from typing import Any
-from urllib.parse import urljoin
 
-# Third Party
-from jinja2 import BaseLoader, Environment, select_autoescape
+# First Party
+from apitester.jsonpath import compile_selector
 
 
-def extract(store: dict[str, Any], selector: str) -> Any:
-    selectors = selector.split(".")
-    cur = store
-    for s in selectors:
-        cur = cur[s]
+def extract(store: Any, selector: str) -> Any:
+    """The value a selector names, or a list of everything it matches if it has wildcards, slices or filters.
 
-    return cur
+    See ``apitester.jsonpath`` for the syntax, plain dotted paths like ``data.orders.0.id`` work too.
+    """
+    return compile_selector(selector).extract(store)
 
 
 def join_url(*args) -> str:
@@ -52,23 +50,3 @@ def suppress(exception, default=None):
         return wrapper_suppress
 
     return decorator_suppress
-
-
-def deferedURLRender(template: str, args: dict[str, Any], base_url: str) -> str:
-    class _proxy(str):
-        template: str
-        args: dict[str, Any]
-        base_url: str
-
-        def __str__(self) -> str:
-            env = Environment(loader=BaseLoader(), autoescape=select_autoescape())
-            template = env.from_string(self.template)
-            rendered = template.render(self.args)
-            return urljoin(self.base_url, rendered)
-
-    proxy = _proxy()
-    proxy.template = template
-    proxy.args = args
-    proxy.base_url = base_url
-
-    return proxy
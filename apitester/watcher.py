@@ -0,0 +1,136 @@
+# Standard Library
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from collections.abc import Callable
+from contextlib import suppress
+
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_CLOEXEC = 0o2000000
+
+_EVENT = struct.Struct("iIII")
+
+
+def _inotify() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+
+    return libc if hasattr(libc, "inotify_init1") and hasattr(libc, "inotify_add_watch") else None
+
+
+class FileWatcher:
+    """Calls ``callback`` from a background thread once ``path`` has stopped changing for ``debounce`` seconds.
+
+    Uses inotify on Linux and falls back to polling the file's mtime and size everywhere else. The directory is
+    watched rather than the file, so editors that save by writing a new file and renaming it are still seen.
+    """
+
+    def __init__(self, path: str, callback: Callable[[], None], debounce: float = 0.3, poll_interval: float = 1.0) -> None:
+        self.path = os.path.abspath(path)
+        self.callback = callback
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        # Write end of a pipe the inotify loop selects on, so stop() wakes it straight away
+        self._wake: int | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+
+        self._stop.clear()
+        libc = _inotify()
+        target = self._watch_inotify if libc is not None else self._watch_polling
+        self._thread = threading.Thread(target=target, args=(libc,) if libc is not None else (), daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 1.0) -> None:
+        self._stop.set()
+        if self._wake is not None:
+            with suppress(OSError):
+                os.write(self._wake, b"\0")
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _watch_inotify(self, libc: ctypes.CDLL) -> None:
+        fd = libc.inotify_init1(IN_CLOEXEC)
+        if fd < 0:
+            return self._watch_polling()
+
+        directory, name = os.path.split(self.path)
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if libc.inotify_add_watch(fd, directory.encode(), mask) < 0:
+            os.close(fd)
+            return self._watch_polling()
+
+        wake, self._wake = os.pipe()
+        pending = False
+        try:
+            while not self._stop.is_set():
+                # Wake up after the debounce once something is pending, otherwise only for events or stop()
+                ready, _, _ = select.select([fd, wake], [], [], self.debounce if pending else None)
+                if wake in ready:
+                    break
+                if not ready:
+                    if pending:
+                        pending = False
+                        self.callback()
+                    continue
+
+                data = os.read(fd, 64 * 1024)
+                for offset, length in self._events(data):
+                    if data[offset : offset + length].rstrip(b"\0").decode(errors="replace") == name:
+                        pending = True
+        finally:
+            write_end, self._wake = self._wake, None
+            for descriptor in (fd, wake, write_end):
+                if descriptor is not None:
+                    os.close(descriptor)
+
+    @staticmethod
+    def _events(data: bytes):
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            _, _, _, length = _EVENT.unpack_from(data, offset)
+            yield offset + _EVENT.size, length
+            offset += _EVENT.size + length
+
+    def _stat(self) -> tuple[float, int] | None:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size
+
+    def _watch_polling(self) -> None:
+        last = self._stat()
+        while not self._stop.wait(self.poll_interval):
+            if (current := self._stat()) == last:
+                continue
+
+            # Keep waiting until a burst of saves has settled
+            while not self._stop.wait(self.debounce) and (settled := self._stat()) != current:
+                current = settled
+
+            last = current
+            if not self._stop.is_set():
+                self.callback()
@@ -3,6 +3,7 @@ from apitester.widgets.endpoint import Endpoint
 from apitester.widgets.form import Form
 from apitester.widgets.labels import AdvancedLabel
 from apitester.widgets.loader import Loader
+from apitester.widgets.timing import TimingPanel
 from apitester.widgets.urltree import URLTree
 
-__all__ = ["Loader", "Endpoint", "URLTree", "AdvancedLabel", "Form"]
+__all__ = ["Loader", "Endpoint", "URLTree", "AdvancedLabel", "Form", "TimingPanel"]
@@ -1,23 +1,28 @@
 # Standard Library
-from contextlib import suppress
+import asyncio
 
 # Third Party
-import aiohttp
-from aiohttp import BasicAuth
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
-from textual.widgets import Button, Input, Label, Pretty, Static
+from textual.widgets import Button, Input, Label, Static
 from textual.worker import Worker, WorkerState
 
 # First Party
-from apitester.auth import auth
+from apitester.cache import CacheStatus
 from apitester.config import config
 from apitester.data import DataStore
+from apitester.history import HistoryStore
+from apitester.load import LoadStats, run_load
 from apitester.plugin_manager import PluginManager
+from apitester.response import ResponseBody
+from apitester.session import SessionManager, request_options
+from apitester.tracing import RequestTiming
 from apitester.url import URL
 from apitester.widgets.labels import AdvancedLabel
 from apitester.widgets.loader import Loader
+from apitester.widgets.response import human_bytes, ResponseViewer
+from apitester.widgets.timing import TimingPanel
 
 
 class Endpoint(Static):
@@ -32,7 +37,8 @@ class Endpoint(Static):
     def __init__(self, url: URL, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.url = url
-        self.store = DataStore(f"{url.url}-{url.method}")
+        self.key = f"{url.url}-{url.method}"
+        self.store = DataStore(self.key)
 
     def on_mount(self):
         for input in self.query("Input"):
@@ -57,8 +63,11 @@ class Endpoint(Static):
 
         with Vertical(id="output"):
             yield Button(self.url.method, id="get-url")
-            with VerticalScroll():
-                yield Pretty(None, id="get-response")
+            yield AdvancedLabel("", prefix="Time: ", id="latency-label")
+            if getattr(self.app, "session_manager").cache is not None:
+                yield AdvancedLabel("", prefix="Cache: ", id="cache-label")
+            yield ResponseViewer(id="get-response")
+            yield TimingPanel(self.key, id="timing")
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         match event.button.id:
@@ -79,37 +88,90 @@ class Endpoint(Static):
 
     @work()
     async def get_url(self):
-        plugins = getattr(self.app, "plugin_manager", PluginManager(self.log))
-
-        headers = plugins.get_headers({"accept": "application/json"})
-        cookies = plugins.get_cookies()
-
-        basic_auth = None
-
-        with suppress(KeyError):
-            match config.auth.type:
-                case "bearer":
-                    headers["Authorization"] = f"Bearer {auth['token']}"
-                case "header":
-                    headers[getattr(config.auth, "key")] = auth["api_key"]
-                case "basic":
-                    basic_auth = BasicAuth((auth.username or "").strip(), (auth.password or "").strip())
-
-        if type(output := self.query_one("#get-response")) == Pretty:
-            async with aiohttp.ClientSession(headers=headers, cookies=cookies, auth=basic_auth) as session:
-                try:
-                    method = self.url.method.lower()
-                    request_data = {f: self.url[f] for f in self.url.fields}
-
-                    async with getattr(session, method)(str(self.url), data=request_data) as response:
-                        if "json" in response.content_type:
-                            data = await response.json()
-                        else:
-                            data = await response.text()
-                            data = data.replace("\\n", "\n").replace("\\t", "\t")
-                        output.update(data)
-                except Exception as e:
-                    output.update({"exception": type(e), "message": str(e), "dict": e.__dict__})
+        plugins = PluginManager.instance()
+        sessions: SessionManager = getattr(self.app, "session_manager")
+        history: HistoryStore = getattr(self.app, "history_store")
+
+        options = request_options(plugins)
+
+        if type(output := self.query_one("#get-response")) == ResponseViewer:
+            url = str(self.url)
+            variables = {v: self.url[v] for v in self.url.variables() if v in self.url}
+            timing = RequestTiming()
+            cache = CacheStatus()
+
+            try:
+                request_data = {f: self.url[f] for f in self.url.fields}
+
+                async with sessions.request(
+                    self.url.method, url, data=request_data, timing=timing, cache=cache, **options
+                ) as response:
+                    body = await ResponseBody.read(
+                        response, config.response.max_memory, config.response.chunk_size, on_chunk=output.received
+                    )
+                timing.finish(body.size)
+
+                self.query_one("#timing", TimingPanel).record(timing)
+                await asyncio.to_thread(
+                    history.record,
+                    self.key,
+                    self.url.method,
+                    url,
+                    variables,
+                    response.status,
+                    dict(response.headers),
+                    timing.as_dict(),
+                    body.data,
+                    body.content_type,
+                )
+                await output.show_body(body, config.response.lazy_over)
+                if type(label := self.query_one("#latency-label")) == AdvancedLabel:
+                    label.update(f"{(timing.total or 0) * 1000:.1f}ms")
+                if sessions.cache is not None:
+                    self.query_one("#cache-label", AdvancedLabel).update(self._describe_cache(cache, sessions.cache.saved))
+            except Exception as e:
+                timing.finish()
+                await asyncio.to_thread(history.record, self.key, self.url.method, url, variables, None, {}, timing.as_dict())
+                output.show({"exception": type(e), "message": str(e), "dict": e.__dict__})
+
+    @staticmethod
+    def _describe_cache(cache: CacheStatus, total: int) -> str:
+        match cache.outcome:
+            case "hit":
+                described = f"served from cache, {human_bytes(cache.saved)} saved"
+            case "revalidated":
+                described = f"revalidated (304), {human_bytes(cache.saved)} saved"
+            case "fetched":
+                described = "fetched fresh" + (" and stored" if cache.stored else "")
+            case _:
+                described = "not cached"
+
+        return f"{described} ({human_bytes(total)} saved this session)"
+
+    @work(exit_on_error=False)
+    async def load_test(self, params) -> None:
+        plugins = PluginManager.instance()
+        sessions: SessionManager = getattr(self.app, "session_manager")
+
+        if type(output := self.query_one("#get-response")) == ResponseViewer:
+
+            def progress(stats: LoadStats) -> None:
+                output.show(stats.report())
+
+            try:
+                stats = await run_load(
+                    sessions,
+                    self.url,
+                    plugins,
+                    concurrency=params.concurrency,
+                    rps=params.rps or None,
+                    duration=params.duration or None,
+                    requests=params.requests or None,
+                    on_progress=progress,
+                )
+                output.show(stats.report())
+            except Exception as e:
+                output.show({"exception": type(e), "message": str(e), "dict": e.__dict__})
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         match event.state:
@@ -118,12 +180,12 @@ class Endpoint(Static):
                     self.query_one("#loader").mount(Loader())
                 self.loadingCount += 1
 
-                if event.worker.name == "get_url":
+                if event.worker.name in ("get_url", "load_test"):
                     self.query_one("#get-url").disabled = True
-            case WorkerState.SUCCESS:
+            case WorkerState.SUCCESS | WorkerState.ERROR | WorkerState.CANCELLED:
                 self.loadingCount -= 1
                 if self.loadingCount == 0:
                     self.query_one("#loader").remove_children()
 
-                    if event.worker.name == "get_url":
+                    if event.worker.name in ("get_url", "load_test"):
                         self.query_one("#get-url").disabled = False
@@ -88,9 +88,9 @@ class Form(Widget, Generic[T]):
                 case ["string"]:
                     _widget = Input(id=_id, **default_args)
                 case ["integer"]:
-                    _widget = Input(validators=default_args["validators"] + [(Integer())], **default_args)
+                    _widget = Input(id=_id, **{**default_args, "validators": default_args["validators"] + [Integer()]})
                 case ["number"]:
-                    _widget = Input(validators=default_args["validators"] + [(Number())], **default_args)
+                    _widget = Input(id=_id, **{**default_args, "validators": default_args["validators"] + [Number()]})
                 case [unmatched]:
                     raise Exception(f"Unmatched: {unmatched}")
 
@@ -0,0 +1,218 @@
+# Standard Library
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+# Third Party
+from rich.cells import cell_len
+from rich.segment import Segment
+from rich.style import Style
+from rich.text import Text
+from textual.app import ComposeResult
+from textual.containers import Container, Vertical
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
+
+# First Party
+from apitester.response import RawJSON, ResponseBody
+from apitester.widgets.labels import AdvancedLabel
+
+
+def human_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+@dataclass
+class _Children:
+    value: dict | list
+    loaded: int = 0
+
+
+@dataclass
+class _More:
+    parent: TreeNode
+
+
+class JSONTree(Tree[Any]):
+    """Collapsible JSON, children are created a page at a time on expand."""
+
+    page_size = 200
+    max_label = 200
+
+    def __init__(self, data: Any, *args, **kwargs) -> None:
+        super().__init__(self._describe(None, data), *args, **kwargs)
+        self.root.data = _Children(data) if isinstance(data, dict | list) else None
+        self.root.allow_expand = self.root.data is not None
+
+    def on_mount(self) -> None:
+        self.root.expand()
+        self._load_page(self.root)
+
+    @classmethod
+    def _describe(cls, key: Any, value: Any) -> Text:
+        label = Text()
+        if key is not None:
+            label.append(f"{key}", style="bold")
+            label.append(": ")
+
+        match value:
+            case dict():
+                label.append(f"{{…}} {len(value)} keys", style="dim")
+            case list():
+                label.append(f"[…] {len(value)} items", style="dim")
+            case _:
+                shown = repr(value)
+                label.append(shown if len(shown) <= cls.max_label else f"{shown[: cls.max_label]}…")
+
+        return label
+
+    def _load_page(self, node: TreeNode) -> None:
+        if not isinstance(children := node.data, _Children):
+            return
+
+        items = children.value.items() if isinstance(children.value, dict) else enumerate(children.value)
+        start, end = children.loaded, min(children.loaded + self.page_size, len(children.value))
+
+        for key, value in islice(items, start, end):
+            if isinstance(value, RawJSON):
+                try:
+                    value = value.decode()
+                except ValueError as e:
+                    value = f"invalid JSON: {e}"
+
+            if isinstance(value, dict | list) and value:
+                node.add(self._describe(key, value), data=_Children(value))
+            else:
+                node.add_leaf(self._describe(key, value))
+
+        children.loaded = end
+        if end < len(children.value):
+            node.add_leaf(Text(f"… {len(children.value) - end} more", style="italic"), data=_More(node))
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        event.stop()
+        if isinstance(event.node.data, _Children) and event.node.data.loaded == 0:
+            self._load_page(event.node)
+
+    def on_tree_node_collapsed(self, event: Tree.NodeCollapsed) -> None:
+        event.stop()
+
+    def on_tree_node_highlighted(self, event: Tree.NodeHighlighted) -> None:
+        event.stop()
+
+    def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
+        event.stop()
+        if isinstance(more := event.node.data, _More):
+            event.node.remove()
+            self._load_page(more.parent)
+
+
+class BodyText(ScrollView, can_focus=True):
+    """Lines of text, only the visible rows are decoded and rendered."""
+
+    DEFAULT_CSS = """
+    BodyText {
+        overflow: scroll;
+    }
+    """
+
+    def __init__(self, lines: Sequence[str], *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lines = lines
+        self._width = 0
+        self.virtual_size = Size(0, len(lines))
+
+    def line_style(self, line: str) -> Style:
+        return self.rich_style
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        rich_style = self.rich_style
+
+        if (index := scroll_y + y) >= len(self.lines):
+            return Strip.blank(width, rich_style)
+
+        line = self.lines[index].expandtabs()
+        if (length := cell_len(line)) > self._width:
+            # Only the lines that have been seen count toward the scrollable width
+            self._width = length
+            self.virtual_size = Size(self._width, len(self.lines))
+
+        return Strip([Segment(line, self.line_style(line))], length).crop_extend(scroll_x, scroll_x + width, rich_style)
+
+
+class ResponseViewer(Vertical):
+    DEFAULT_CSS = """
+    ResponseViewer {
+        height: 1fr;
+    }
+    ResponseViewer > #response-body {
+        height: 1fr;
+    }
+    ResponseViewer > #response-body > * {
+        height: 1fr;
+    }
+    """
+
+    _body: ResponseBody | None = None
+
+    def compose(self) -> ComposeResult:
+        yield AdvancedLabel("", prefix="Received: ", id="response-bytes")
+        yield Container(id="response-body")
+
+    def received(self, size: int, suffix: str = "") -> None:
+        self.query_one("#response-bytes", AdvancedLabel).update(f"{human_bytes(size)}{suffix}")
+
+    def _replace(self, widget) -> None:
+        if self._body is not None:
+            self._body.close()
+            self._body = None
+
+        container = self.query_one("#response-body")
+        container.remove_children()
+        container.mount(widget)
+
+    def show(self, data: Any) -> None:
+        if isinstance(data, dict | list):
+            self._replace(JSONTree(data))
+        else:
+            self._replace(BodyText(str(data).splitlines()))
+
+    async def show_body(self, body: ResponseBody, lazy_over: int | None = None) -> None:
+        """Decode the body off the event loop, then show it."""
+        self.received(body.size, " (spilled to disk)" if body.spilled else "")
+
+        if body.is_json:
+            data = await asyncio.to_thread(body.json, lazy_over)
+            self._replace(JSONTree(data) if isinstance(data, dict | list) else BodyText([repr(data)]))
+            if body.decodes_lazily(lazy_over):
+                # The undecoded parts of the tree point into the body, so it stays open as long as the tree
+                self._body = body
+            else:
+                body.close()
+        elif body.spilled:
+            lines = await asyncio.to_thread(body.lines)
+            self._replace(BodyText(lines))
+            self._body = body
+        else:
+
+            def split() -> list[str]:
+                return body.text().replace("\\n", "\n").replace("\\t", "\t").splitlines()
+
+            lines = await asyncio.to_thread(split)
+            body.close()
+            self._replace(BodyText(lines))
+
+    def on_unmount(self) -> None:
+        if self._body is not None:
+            self._body.close()
@@ -0,0 +1,77 @@
+# Standard Library
+from collections import defaultdict, deque
+
+# Third Party
+from rich.table import Table
+from rich.text import Text
+from textual.app import ComposeResult
+from textual.containers import Vertical
+from textual.widgets import Sparkline, Static
+
+# First Party
+from apitester.tracing import RequestTiming
+from apitester.widgets.response import human_bytes
+
+PHASES = [
+    ("DNS", "dns"),
+    ("Queued", "queued"),
+    ("Connect", "connect"),
+    ("Send", "send"),
+    ("TTFB", "ttfb"),
+    ("Download", "download"),
+]
+
+
+class TimingPanel(Vertical):
+    """Breakdown of the last request, with the totals of recent requests to the same endpoint."""
+
+    DEFAULT_CSS = """
+    TimingPanel {
+        height: auto;
+    }
+    TimingPanel > Sparkline {
+        height: 2;
+    }
+    """
+
+    history_size = 50
+    history: dict[str, deque[RequestTiming]] = defaultdict(lambda: deque(maxlen=TimingPanel.history_size))
+
+    def __init__(self, key: str, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.key = key
+
+    def compose(self) -> ComposeResult:
+        yield Static(id="timing-breakdown")
+        yield Sparkline(self._totals(), id="timing-history")
+
+    def on_mount(self) -> None:
+        if self.history[self.key]:
+            self._show(self.history[self.key][-1])
+
+    def _totals(self) -> list[float]:
+        return [t.total * 1000 for t in self.history[self.key] if t.total is not None]
+
+    def record(self, timing: RequestTiming) -> None:
+        self.history[self.key].append(timing)
+        self._show(timing)
+        self.query_one("#timing-history", Sparkline).data = self._totals()
+
+    def _show(self, timing: RequestTiming) -> None:
+        total = timing.total or 0
+        table = Table.grid(padding=(0, 1))
+        table.add_column(style="bold")
+        table.add_column(justify="right")
+        table.add_column()
+
+        for label, attr in PHASES:
+            if (value := getattr(timing, attr)) is None:
+                continue
+            bar = "█" * round(value / total * 30) if total else ""
+            table.add_row(label, f"{value * 1000:.1f}ms", Text(bar, style="green"))
+
+        connection = "reused connection" if timing.reused else "new connection"
+        sent, received = human_bytes(timing.bytes_sent), human_bytes(timing.bytes_received)
+        table.add_row("Total", f"{total * 1000:.1f}ms", Text(f"{connection}, ↑{sent} ↓{received}", style="dim"))
+
+        self.query_one("#timing-breakdown", Static).update(table)
@@ -1,18 +1,32 @@
 # Standard Library
+from dataclasses import dataclass
 
 # Third Party
 from textual.app import ComposeResult
 from textual.widgets import Static, Tree
+from textual.widgets.tree import TreeNode
 
 # Locals
-from ..config import URLConf
+from ..config import ConfigDiff, diff_urls, iter_urls, URLConf
+from ..url import URL
+from ..utils import extract
+
+
+@dataclass
+class _Branch:
+    path: str
+    populated: bool = False
 
 
 class URLTree(Static):
+    """The url catalog as a tree, each branch's children are only created the first time it is expanded."""
+
     urls: URLConf
 
     def __init__(self, urls, *args, **kwargs) -> None:
         self.urls = urls
+        self._paths: dict[str, URL] = dict(iter_urls(urls)) if urls is not None else {}
+        self._tree_nodes: dict[str, TreeNode] = {}
         super().__init__(*args, **kwargs)
 
     def focus(self, scroll_visible: bool = True) -> Tree[dict]:
@@ -22,27 +36,98 @@ class URLTree(Static):
         raise Exception("Tree not mounted")
 
     def compose(self) -> ComposeResult:
-        tree: Tree[dict] = Tree("URLs")
+        tree: Tree = Tree("URLs", data=_Branch(""))
+        self._tree_nodes[""] = tree.root
 
         if self.urls is not None:
-            self._build_tree(self.urls, tree.root)
+            self._populate(tree.root)
 
-        tree.root.expand_all()
+        tree.root.expand()
 
         yield tree
 
-    @classmethod
-    def _build_tree(cls, items: dict, node):
+    def _populate(self, node: TreeNode) -> None:
+        branch: _Branch = node.data
+        branch.populated = True
+        items = extract(self.urls, branch.path) if branch.path else self.urls
+
         for key, val in items.items():
+            path = f"{branch.path}.{key}" if branch.path else key
             if isinstance(val, dict):
-                cls._build_tree(val, node.add(key))
+                self._tree_nodes[path] = node.add(key, data=_Branch(path))
             else:
-                node.add_leaf(f"{key} - {val.url}", data={"url": val})
+                self._tree_nodes[path] = node.add_leaf(self._label(path, val), data={"url": val})
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        if isinstance(branch := event.node.data, _Branch) and not branch.populated:
+            self._populate(event.node)
+
+    @staticmethod
+    def _label(path: str, url: URL) -> str:
+        return f"{path.rpartition('.')[2]} - {url.url}"
+
+    def _is_populated(self, path: str) -> bool:
+        return (node := self._tree_nodes.get(path)) is not None and isinstance(node.data, _Branch) and node.data.populated
+
+    def _forget(self, path: str) -> None:
+        if (node := self._tree_nodes.pop(path, None)) is not None:
+            node.remove()
+        prefix = f"{path}."
+        for descendant in [p for p in self._tree_nodes if p.startswith(prefix)]:
+            del self._tree_nodes[descendant]
+
+    def reveal(self, path: str) -> None:
+        """Build and expand every branch down to ``path``, then select it."""
+        tree: Tree = self.query_one(Tree)
+        parts = path.split(".")
+        for depth in range(len(parts)):
+            if (node := self._tree_nodes.get(".".join(parts[:depth]))) is None:
+                return
+            if isinstance(node.data, _Branch) and not node.data.populated:
+                self._populate(node)
+            node.expand()
+
+        if (node := self._tree_nodes.get(path)) is not None:
+
+            def select() -> None:
+                tree.select_node(node)
+                tree.scroll_to_node(node)
+
+            # Lines are only laid out for newly expanded branches on the next refresh
+            self.call_after_refresh(select)
+
+    def update(self, urls: URLConf) -> ConfigDiff:
+        """Apply only what changed since the tree was last built, keeping expansion and selection.
+
+        Branches that have never been expanded are left alone, they are built from the new urls when they are.
+        """
+        paths = dict(iter_urls(urls))
+        diff = diff_urls(self._paths, paths)
+        self.urls, self._paths = urls, paths
+
+        branches = {path.rsplit(".", depth)[0] for path in paths for depth in range(1, path.count(".") + 1)}
+        for path in diff.removed:
+            self._forget(path)
+            parent = path.rpartition(".")[0]
+            while parent and parent not in branches:
+                self._forget(parent)
+                parent = parent.rpartition(".")[0]
+
+        for path, url in diff.changed.items():
+            if (node := self._tree_nodes.get(path)) is not None:
+                node.set_label(self._label(path, url))
+                node.data = {"url": url}
 
-    def update(self, urls: URLConf):
-        tree: Tree[dict] = self.query_one(Tree)
+        for path, url in diff.added.items():
+            parent = path.rpartition(".")[0]
+            if self._is_populated(parent):
+                self._tree_nodes[path] = self._tree_nodes[parent].add_leaf(self._label(path, url), data={"url": url})
+                continue
 
-        tree.root.remove_children()
-        self._build_tree(urls, tree.root)
+            # Create the highest missing branch under a built one, anything below it is built when it is expanded
+            while parent and parent not in self._tree_nodes:
+                path, parent = parent, parent.rpartition(".")[0]
+            if path not in self._tree_nodes and self._is_populated(parent):
+                self._tree_nodes[path] = self._tree_nodes[parent].add(path.rpartition(".")[2], data=_Branch(path))
 
-        tree.root.expand_all()
+        return diff
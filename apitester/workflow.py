@@ -0,0 +1,235 @@
+# Standard Library
+import asyncio
+import re
+import time
+import tomllib
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from graphlib import CycleError, TopologicalSorter
+from typing import Any
+
+# Third Party
+from pydantic import BaseModel
+
+# First Party
+from apitester.config import config
+from apitester.jsonpath import SelectorSet
+from apitester.plugin_manager import PluginManager
+from apitester.runner import execute
+from apitester.session import SessionManager, request_options
+from apitester.url import URL
+
+_reference = re.compile(r"(?P<step>[^.\[]+)\.?(?P<selector>.*)")
+
+
+def split_reference(reference: str) -> tuple[str, str]:
+    """The step a reference like ``list.data.orders[*].id`` reads from, and the selector into its response."""
+    if not (match := _reference.fullmatch(reference.strip())):
+        raise ValueError(f"Can't read {reference!r} as a step name and selector")
+    return match["step"], match["selector"]
+
+
+class WorkflowStep(BaseModel):
+    """One endpoint in a workflow.
+
+    ``bind`` and ``each`` take references like ``list.data.orders[*].order_id``, the name of an earlier step
+    followed by a selector into its response (see ``apitester.jsonpath``). A step with ``each`` is called once
+    per item of the list its references select, and its response is then the list of their responses.
+    """
+
+    endpoint: str
+    variables: dict[str, str] = {}
+    bind: dict[str, str] = {}
+    each: dict[str, str] = {}
+    after: list[str] = []
+
+    @property
+    def needs(self) -> set[str]:
+        return {split_reference(ref)[0] for ref in [*self.bind.values(), *self.each.values()]} | set(self.after)
+
+
+class Workflow(BaseModel):
+    concurrency: int = 8
+    steps: dict[str, WorkflowStep]
+
+    @classmethod
+    def load(cls, path: str) -> "Workflow":
+        with open(path, "rb") as f:
+            workflow = cls(**tomllib.load(f))
+
+        for name, step in workflow.steps.items():
+            if unknown := step.needs - workflow.steps.keys():
+                raise ValueError(f"{name} refers to unknown steps {', '.join(sorted(unknown))}")
+
+        try:
+            TopologicalSorter(workflow.graph).prepare()
+        except CycleError as e:
+            raise ValueError(f"Steps depend on each other in a cycle: {' -> '.join(e.args[1])}") from e
+
+        return workflow
+
+    @property
+    def graph(self) -> dict[str, set[str]]:
+        return {name: step.needs for name, step in self.steps.items()}
+
+
+@dataclass
+class StepResult:
+    name: str
+    started: float = 0.0
+    finished: float = 0.0
+    calls: list[dict[str, Any]] = field(default_factory=list)
+    response: Any = None
+    error: str | None = None
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.skipped and self.error is None
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+    def as_dict(self) -> dict[str, Any]:
+        result: dict[str, Any] = {"step": self.name, "calls": len(self.calls)}
+        if self.skipped:
+            return result | {"skipped": True}
+
+        result |= {
+            "started_ms": round(self.started * 1000, 3),
+            "elapsed_ms": round(self.duration * 1000, 3),
+            "statuses": sorted({call["status"] for call in self.calls if "status" in call}),
+        }
+        return result | {"error": self.error} if self.error else result
+
+
+@dataclass
+class WorkflowReport:
+    steps: dict[str, StepResult]
+    graph: dict[str, set[str]]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return all(step.ok for step in self.steps.values())
+
+    def critical_path(self) -> list[str]:
+        """The chain of steps, each waiting on the one before it, that ended last and so set the total time."""
+        if not (ran := [step for step in self.steps.values() if not step.skipped]):
+            return []
+
+        path = [max(ran, key=lambda step: step.finished).name]
+        while needs := [self.steps[name] for name in self.graph[path[-1]] if not self.steps[name].skipped]:
+            path.append(max(needs, key=lambda step: step.finished).name)
+
+        return path[::-1]
+
+    def as_dict(self) -> dict[str, Any]:
+        path = self.critical_path()
+        return {
+            "ok": self.ok,
+            "elapsed_ms": round(self.elapsed * 1000, 3),
+            "critical_path": path,
+            "critical_path_ms": round(sum(self.steps[name].duration for name in path) * 1000, 3),
+            "steps": [step.as_dict() for step in self.steps.values()],
+        }
+
+
+def _resolve(references: dict[str, str], results: dict[str, StepResult]) -> dict[str, Any]:
+    """The value of every reference, those into the same step's response looked up together in a SelectorSet."""
+    by_step: dict[str, dict[str, str]] = {}
+    for name, reference in references.items():
+        step, selector = split_reference(reference)
+        by_step.setdefault(step, {})[name] = selector
+
+    values: dict[str, Any] = {}
+    for step, selectors in by_step.items():
+        values |= SelectorSet(selectors).evaluate(results[step].response)
+        if missing := selectors.keys() - values.keys():
+            raise KeyError(f"Nothing in {step}'s response at {', '.join(selectors[name] for name in sorted(missing))}")
+
+    return values
+
+
+def _bindings(step: WorkflowStep, results: dict[str, StepResult], variables: dict[str, str]) -> list[dict[str, str]]:
+    references = {f"bind:{var}": ref for var, ref in step.bind.items()} | {f"each:{var}": ref for var, ref in step.each.items()}
+    found = _resolve(references, results)
+
+    values = variables | step.variables | {var: str(found[f"bind:{var}"]) for var in step.bind}
+    if not step.each:
+        return [values]
+
+    columns = {var: found[f"each:{var}"] for var in step.each}
+    for var, column in columns.items():
+        if not isinstance(column, list):
+            raise ValueError(f"each {var} selected {type(column).__name__}, not a list")
+
+    return [values | {var: str(value) for var, value in zip(columns, row)} for row in zip(*columns.values())]
+
+
+async def run_workflow(
+    sessions: SessionManager,
+    workflow: Workflow,
+    variables: dict[str, str] | None = None,
+    plugins: PluginManager | None = None,
+    on_step: Callable[[StepResult], None] | None = None,
+) -> WorkflowReport:
+    """Run every step once the steps it depends on have finished, independent steps at the same time."""
+    plugins = plugins or PluginManager.instance()
+    variables = variables or {}
+    semaphore = asyncio.Semaphore(workflow.concurrency)
+    results: dict[str, StepResult] = {}
+    start = time.perf_counter()
+
+    async def call(name: str, url: URL, values: dict[str, str]) -> dict[str, Any]:
+        async with semaphore:
+            return await execute(sessions, name, url, request_options(plugins), values)
+
+    async def run_step(name: str) -> None:
+        step = workflow.steps[name]
+        results[name] = result = StepResult(name, started=time.perf_counter() - start)
+
+        if not all(results[need].ok for need in step.needs):
+            result.skipped = True
+            return
+
+        try:
+            url = config.select(step.endpoint)[step.endpoint]
+            bindings = _bindings(step, results, variables)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            result.error = f"{type(e).__name__}: {e}"
+        else:
+            result.calls = list(await asyncio.gather(*(call(step.endpoint, url, values) for values in bindings)))
+            responses = [call.get("body") for call in result.calls]
+            result.response = responses if step.each else responses[0]
+            if failed := [call for call in result.calls if "error" in call or call["status"] >= 400]:
+                result.error = f"{len(failed)} of {len(result.calls)} calls failed"
+
+        result.finished = time.perf_counter() - start
+
+    sorter = TopologicalSorter(workflow.graph)
+    sorter.prepare()
+    running: dict[asyncio.Task, str] = {}
+    while sorter.is_active():
+        for name in sorter.get_ready():
+            running[asyncio.create_task(run_step(name))] = name
+
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            name = running.pop(task)
+            task.result()
+            sorter.done(name)
+            if on_step is not None:
+                on_step(results[name])
+
+    return WorkflowReport(results, workflow.graph, time.perf_counter() - start)
+
+
+async def run_file(workflow: Workflow, variables: dict[str, str]) -> WorkflowReport:
+    config.load_openapi()
+    sessions = SessionManager(config.session)
+    try:
+        return await run_workflow(sessions, workflow, variables)
+    finally:
+        await sessions.close()
@@ -0,0 +1,72 @@
+"""Repeated GETs of a 2MB JSON body from a local server: no cache, answered
+from the cache while fresh, and revalidated with If-None-Match once stale.
+
+Run from the project root: python -m benchmarks.http_cache
+"""
+# Standard Library
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+# Third Party
+from aiohttp import web
+
+# First Party
+from apitester.cache import CacheStatus
+from apitester.config import config
+from apitester.session import SessionManager
+
+CALLS = 50
+BODY = json.dumps({"orders": [{"id": i, "status": "paid", "total": i * 1.5} for i in range(40_000)]}).encode()
+
+
+async def handler(request: web.Request) -> web.Response:
+    headers = {"ETag": '"orders-v1"', "Cache-Control": request.query.get("cache_control", "max-age=60")}
+    if request.headers.get("If-None-Match") == headers["ETag"]:
+        return web.Response(status=304, headers=headers)
+    return web.Response(body=BODY, content_type="application/json", headers=headers)
+
+
+async def timed(sessions: SessionManager, url: str) -> tuple[float, CacheStatus]:
+    status = CacheStatus()
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        async with sessions.request("GET", url, cache=status) as response:
+            await response.read()
+    return (time.perf_counter() - start) / CALLS * 1000, status
+
+
+async def main() -> None:
+    app = web.Application()
+    app.router.add_get("/orders", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 8790).start()
+
+    with tempfile.TemporaryDirectory() as directory:
+        config.cache.path = str(Path(directory) / "cache.db")
+        print(f"{len(BODY) / 1024 / 1024:.1f}MB body, {CALLS} calls each")
+
+        for label, enabled, cache_control in (
+            ("no cache", False, "max-age=60"),
+            ("fresh", True, "max-age=60"),
+            ("revalidated", True, "no-cache"),
+        ):
+            config.cache.enabled = enabled
+            sessions = SessionManager(config.session)
+            url = f"http://127.0.0.1:8790/orders?cache_control={cache_control}"
+            async with sessions.request("GET", url) as response:
+                await response.read()
+
+            per_call, status = await timed(sessions, url)
+            saved = sessions.cache.saved / 1024 / 1024 if sessions.cache is not None else 0
+            print(f"{label:>12}: {per_call:7.2f}ms per call  {status.outcome:<11}  {saved:6.1f}MB not downloaded")
+            await sessions.close()
+
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
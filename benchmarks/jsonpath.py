@@ -0,0 +1,94 @@
+"""Selector evaluation: a dotted path split on every call (the old extract)
+against the compiled and cached selector, several selectors run separately
+against a SelectorSet, which walks the steps they share once, and peak memory
+picking ids out of a large array by decoding it whole against streaming it.
+
+Run from the project root: python -m benchmarks.jsonpath
+"""
+# Standard Library
+import json
+import timeit
+import tracemalloc
+
+# First Party
+from apitester.jsonpath import compile_selector, SelectorSet, stream
+from apitester.response import loads
+
+NUMBER = 20_000
+SELECTORS = {
+    "sharing $.data.orders": {
+        "ids": "$.data.orders[*].id",
+        "paid": "$.data.orders[?(@.status == 'paid')].id",
+        "totals": "$.data.orders[*].total",
+        "first": "$.data.orders[0].id",
+    },
+    "sharing a filter": {
+        "ids": "$.data.orders[?(@.status == 'paid' && @.total > 10)].id",
+        "totals": "$.data.orders[?(@.status == 'paid' && @.total > 10)].total",
+        "skus": "$.data.orders[?(@.status == 'paid' && @.total > 10)].lines[*].sku",
+    },
+    "sharing ..": {
+        "ids": "$..orders[*].id",
+        "totals": "$..orders[*].total",
+        "skus": "$..orders[*].lines[*].sku",
+    },
+}
+
+
+def split_extract(store, selector: str):
+    for key in selector.split("."):
+        store = store[key]
+    return store
+
+
+def per_call(*funcs, number: int = NUMBER, rounds: int = 15) -> list[float]:
+    """Best time per call of each function, timed in turns so a noisy machine slows them alike."""
+    best = [float("inf")] * len(funcs)
+    for _ in range(rounds):
+        for index, func in enumerate(funcs):
+            best[index] = min(best[index], timeit.timeit(func, number=number))
+    return [seconds / number * 1_000_000 for seconds in best]
+
+
+def peak(func) -> tuple[int, float]:
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return len(result), peak / 1024 / 1024
+
+
+def main() -> None:
+    orders = [
+        {"id": i, "status": "paid" if i % 2 else "new", "total": i, "lines": [{"sku": j} for j in range(3)]} for i in range(50)
+    ]
+    document = {"data": {"token": "abc", "orders": orders}}
+
+    before, after = per_call(
+        lambda: split_extract(document, "data.token"), lambda: compile_selector("data.token").extract(document)
+    )
+    print(f"definite path: split {before:6.2f}us  compiled {after:6.2f}us")
+
+    for label, texts in SELECTORS.items():
+        selectors = {name: compile_selector(text) for name, text in texts.items()}
+        combined = SelectorSet(texts)
+        before, after = per_call(
+            lambda: {name: selector.find(document) for name, selector in selectors.items()},
+            lambda: combined.evaluate(document),
+            number=200,
+        )
+        print(f"{len(texts)} selectors {label:<21}: separately {before:7.1f}us  SelectorSet {after:7.1f}us")
+
+    orders = [{"id": i, "lines": [{"sku": f"sku-{j}"} for j in range(20)]} for i in range(50_000)]
+    encoded = json.dumps({"data": {"orders": orders}}).encode()
+    del orders
+    chunks = lambda: (encoded[i : i + 65536] for i in range(0, len(encoded), 65536))  # noqa: E731
+    print(f"{len(encoded) / 1024 / 1024:.0f}MB array:")
+    count, whole = peak(lambda: compile_selector("$.data.orders[*].id").find(loads(encoded)))
+    print(f"  decoded whole {whole:7.1f}MB peak for {count} ids")
+    count, streamed = peak(lambda: list(stream("$.data.orders[*].id", chunks())))
+    print(f"  streamed      {streamed:7.1f}MB peak for {count} ids")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Event loop stalls while a ~20MB JSON response is decoded.
+
+A ticker on the loop stands in for Textual's message pump, the worst gap
+between its ticks is the frame latency the UI would see.
+
+Run from the project root: python -m benchmarks.response_decode
+"""
+# Standard Library
+import asyncio
+import json
+import time
+
+# First Party
+from apitester.response import ResponseBody, loads, orjson
+
+
+def make_body(target: int = 20 * 1024 * 1024) -> ResponseBody:
+    order = {"id": 0, "status": "new", "customer": {"name": "A Customer", "email": "a@example.com"}, "lines": [1, 2, 3]}
+    count = target // len(json.dumps(order))
+    raw = json.dumps({"data": {"orders": [{**order, "id": i} for i in range(count)]}}).encode()
+
+    body = ResponseBody(max_memory=len(raw) + 1, content_type="application/json")
+    body.write(raw)
+    body.finish()
+    return body
+
+
+async def measure(decode) -> tuple[float, float]:
+    gaps: list[float] = []
+    done = False
+
+    async def ticker() -> None:
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await decode()
+    elapsed = time.perf_counter() - start
+    done = True
+    await task
+
+    return elapsed, max(gaps)
+
+
+async def main() -> None:
+    body = make_body()
+    print(f"body: {body.size / 1024 / 1024:.1f}MiB, orjson: {'yes' if orjson is not None else 'no'}")
+
+    async def inline() -> None:
+        json.loads(body.data)
+
+    async def threaded() -> None:
+        await asyncio.to_thread(loads, body.data)
+
+    async def lazy() -> None:
+        await asyncio.to_thread(body.json, 0)
+
+    for name, decode in (("json on the loop", inline), ("thread", threaded), ("thread, lazy", lazy)):
+        elapsed, worst = await measure(decode)
+        print(f"{name:>20}: decode {elapsed * 1000:7.1f}ms  worst frame {worst * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
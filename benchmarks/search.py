@@ -0,0 +1,45 @@
+"""Per-query search time over a generated catalog of 50,000 endpoints, which
+should stay under 5ms so results keep up with typing.
+
+Run from the project root: python -m benchmarks.search
+"""
+# Standard Library
+import random
+import time
+import timeit
+
+# First Party
+from apitester.config import URL
+from apitester.search import SearchIndex
+
+WORDS = ["order", "customer", "product", "invoice", "shipping", "label", "pick", "ship", "details", "list"]
+WORDS += ["refund", "stock", "warehouse", "supplier", "payment", "auth", "token", "report", "export", "import"]
+QUERIES = ["o", "or", "order", "api", "post", "refund_stock12", "ordr det", "shiping lable", "zzzz"]
+NUMBER = 20
+
+
+def catalog(groups: int = 400, per_group: int = 125) -> dict:
+    random.seed(1)
+    urls: dict[str, dict] = {}
+    for g in range(groups):
+        group = urls.setdefault(f"{random.choice(WORDS)}{g}", {})
+        for e in range(per_group):
+            name = f"{random.choice(WORDS)}_{random.choice(WORDS)}{e}"
+            group[name] = URL(f"/api/{random.choice(WORDS)}/{name}?id={{{{ id }}}}", random.choice(["GET", "POST"]))
+    return urls
+
+
+def main() -> None:
+    urls = catalog()
+
+    start = time.perf_counter()
+    index = SearchIndex(urls)
+    print(f"indexed {len(index)} endpoints in {time.perf_counter() - start:.2f}s")
+
+    for query in QUERIES:
+        per_query = min(timeit.repeat(lambda: index.search(query), number=NUMBER, repeat=3)) / NUMBER * 1000
+        print(f"{query!r:>18}: {per_query:6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
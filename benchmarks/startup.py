@@ -0,0 +1,71 @@
+"""Cold start of the TUI, each run in a fresh interpreter: the imports done by
+``python -m apitester`` before the app runs, and the time until its first
+paint. Exits non-zero if the median goes over budget, or if a dependency only
+needed later (requests, keyring, templates, YAML) was imported before the
+first paint.
+
+Run from the project root: python -m benchmarks.startup
+"""
+# Standard Library
+import json
+import statistics
+import subprocess
+import sys
+
+RUNS = 7
+IMPORT_BUDGET_MS = 500
+FIRST_PAINT_BUDGET_MS = 900
+DEFERRED = ["aiohttp", "keyring", "jinja2", "yaml"]
+
+CHILD = """
+import time
+start = time.perf_counter()
+
+import asyncio, json, sys
+import apitester.__main__
+from apitester.app import APITester
+imported = time.perf_counter()
+
+async def main():
+    app = APITester()
+    painted = asyncio.Event()
+    first_paint = app._first_paint
+
+    def probe():
+        nonlocal painted_at, loaded
+        painted_at = time.perf_counter()
+        loaded = [name for name in %r if name in sys.modules]
+        first_paint()
+        painted.set()
+
+    painted_at, loaded, app._first_paint = None, None, probe
+    async with app.run_test(size=(120, 40)):
+        await painted.wait()
+    # Textual captures stdout while the app runs
+    print(json.dumps({"import": (imported - start) * 1000, "first_paint": (painted_at - start) * 1000, "loaded": loaded}))
+
+asyncio.run(main())
+"""
+
+
+def cold_start() -> dict:
+    output = subprocess.run([sys.executable, "-c", CHILD % DEFERRED], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    runs = [cold_start() for _ in range(RUNS)]
+    imports = statistics.median(run["import"] for run in runs)
+    first_paint = statistics.median(run["first_paint"] for run in runs)
+    loaded = sorted({name for run in runs for name in run["loaded"]})
+
+    print(f"import      {imports:7.1f}ms  (budget {IMPORT_BUDGET_MS}ms)")
+    print(f"first paint {first_paint:7.1f}ms  (budget {FIRST_PAINT_BUDGET_MS}ms)")
+    print(f"deferred imports loaded before first paint: {', '.join(loaded) or 'none'}")
+
+    if imports > IMPORT_BUDGET_MS or first_paint > FIRST_PAINT_BUDGET_MS or loaded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Per-call render time of a URL, recompiling the template every call (the
+old behaviour) against the cached template.
+
+Run from the project root: python -m benchmarks.url_render
+"""
+# Standard Library
+import timeit
+from urllib.parse import urljoin
+
+# First Party
+from apitester.config import config
+from apitester.url import environment, URL
+
+NUMBER = 20_000
+
+
+def per_call(func) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1_000_000
+
+
+def main() -> None:
+    base_url = config.settings.base_url
+
+    for name, url in {
+        "templated": URL("/admin/index.php?route=api/order/details&order_id={{ order_id }}"),
+        "static": URL("/admin/index.php?route=api/order/list"),
+    }.items():
+        url["order_id"] = "1234"
+
+        before = per_call(lambda: urljoin(base_url, environment().from_string(url.url).render(url._data)))
+        after = per_call(lambda: urljoin(base_url, url.render()))
+
+        print(f"{name:>10}: before {before:8.2f}us  after {after:8.2f}us  ({before / after:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Time for 100,000 ``str(url)`` calls, resolving the settings from the
+environment on every call (the old behaviour) against the snapshot taken when
+the config is loaded.
+
+Run from the project root: python -m benchmarks.url_str
+"""
+# Standard Library
+import time
+from urllib.parse import urljoin
+
+# First Party
+from apitester.config import config, Settings, URL
+
+CALLS = 100_000
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    config.settings
+
+    for name, url in {
+        "templated": URL("/admin/index.php?route=api/order/details&order_id={{ order_id }}"),
+        "static": URL("/admin/index.php?route=api/order/list"),
+    }.items():
+        url["order_id"] = "1234"
+
+        before = timed(lambda: urljoin(Settings().base_url, url.render()))
+        after = timed(lambda: str(url))
+
+        print(f"{name:>10}: before {before * 1000:8.1f}ms  after {after * 1000:8.1f}ms  ({before / after:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Time from starting the app to its first paint, with a generated catalog of
+each size, building every tree node up front (the old behaviour) against
+building them as branches are expanded.
+
+Run from the project root: python -m benchmarks.urltree
+"""
+# Standard Library
+import asyncio
+import time
+
+# Third Party
+from textual.app import App, ComposeResult
+from textual.widgets import Tree
+
+# First Party
+from apitester.config import URL
+from apitester.widgets import URLTree
+
+SIZES = [100, 1_000, 5_000, 20_000]
+
+
+def catalog(size: int, per_group: int = 50) -> dict:
+    groups: dict[str, dict] = {}
+    for i in range(size):
+        group = groups.setdefault(f"group{i // per_group}", {})
+        group[f"endpoint{i}"] = URL(f"/api/group{i // per_group}/endpoint{i}?id={{{{ id }}}}")
+    return groups
+
+
+class EagerTree(URLTree):
+    def compose(self) -> ComposeResult:
+        tree: Tree[dict] = Tree("URLs")
+        self._build(self.urls, tree.root)
+        tree.root.expand_all()
+        yield tree
+
+    def _build(self, items: dict, node) -> None:
+        for key, val in items.items():
+            if isinstance(val, dict):
+                self._build(val, node.add(key))
+            else:
+                node.add_leaf(f"{key} - {val.url}", data={"url": val})
+
+
+class Bench(App):
+    def __init__(self, tree: type[URLTree], urls: dict) -> None:
+        super().__init__()
+        self.tree_class, self.urls = tree, urls
+        self.painted = asyncio.Event()
+
+    def compose(self) -> ComposeResult:
+        yield self.tree_class(self.urls)
+
+    def on_mount(self) -> None:
+        self.call_after_refresh(self.painted.set)
+
+
+async def first_paint(tree: type[URLTree], urls: dict) -> float:
+    app = Bench(tree, urls)
+    start = time.perf_counter()
+    async with app.run_test(size=(120, 40)):
+        await app.painted.wait()
+        return time.perf_counter() - start
+
+
+async def main() -> None:
+    for size in SIZES:
+        urls = catalog(size)
+        before = await first_paint(EagerTree, urls)
+        after = await first_paint(URLTree, urls)
+        print(f"{size:>7} endpoints: before {before * 1000:8.1f}ms  after {after * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
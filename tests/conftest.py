@@ -0,0 +1,59 @@
+# Standard Library
+import time
+from collections import Counter
+
+# Third Party
+import keyring
+import pytest
+from keyring.backend import KeyringBackend
+from keyring.credentials import SimpleCredential
+
+# First Party
+from apitester.config import config
+
+
+class SlowKeyring(KeyringBackend):
+    """An in memory keyring that takes ``delay`` seconds per call, like a locked or remote one.
+
+    Reads see the keyring as it was when they were made, writes land once the delay is over.
+    """
+
+    priority = 1  # type: ignore[assignment]
+
+    def __init__(self, delay: float = 0.05) -> None:
+        super().__init__()
+        self.delay = delay
+        self.calls: Counter[str] = Counter()
+        self.passwords: dict[tuple[str, str], str] = {}
+
+    def _call(self, name: str) -> None:
+        self.calls[name] += 1
+        time.sleep(self.delay)
+
+    def get_password(self, service, username):
+        password = self.passwords.get((service, username))
+        self._call("get_password")
+        return password
+
+    def get_credential(self, service, username):
+        found = [(user, pw) for (s, user), pw in self.passwords.items() if s == service and username in (None, user)]
+        self._call("get_credential")
+        return SimpleCredential(*found[0]) if found else None
+
+    def set_password(self, service, username, password):
+        self._call("set_password")
+        self.passwords[(service, username)] = password
+
+    def delete_password(self, service, username):
+        self._call("delete_password")
+        del self.passwords[(service, username)]
+
+
+@pytest.fixture
+def backend():
+    previous = keyring.get_keyring()
+    backend = SlowKeyring()
+    backend.passwords[(config.service_name, "someone")] = "secret"
+    keyring.set_keyring(backend)
+    yield backend
+    keyring.set_keyring(previous)
@@ -0,0 +1,57 @@
+# Standard Library
+import threading
+import time
+
+# First Party
+from apitester.auth import Auth
+
+
+def test_lookups_after_warm_up_do_not_touch_the_backend(backend):
+    auth = Auth()
+
+    auth.prefetch()
+    assert backend.calls["get_credential"] == 1
+
+    start = time.perf_counter()
+    for _ in range(100):
+        assert (auth.username, auth.password) == ("someone", "secret")
+
+    assert backend.calls["get_credential"] == 1
+    assert time.perf_counter() - start < backend.delay
+
+
+def test_lookups_are_repeated_once_the_ttl_passes(backend):
+    auth = Auth(ttl=0.01)
+
+    assert auth.username == "someone"
+    time.sleep(0.02)
+    assert auth.username == "someone"
+
+    assert backend.calls["get_credential"] == 2
+
+
+def test_store_is_not_undone_by_a_lookup_during_the_write(backend):
+    auth = Auth()
+    assert auth.password == "secret"
+
+    writer = threading.Thread(target=auth.store, args=("someone", "changed"))
+    writer.start()
+    # Read while set_password is still sleeping, re-caching whatever the keyring held then
+    time.sleep(backend.delay / 2)
+    auth.password
+    writer.join()
+
+    assert auth.password == "changed"
+
+
+def test_remove_is_not_undone_by_a_lookup_during_the_delete(backend):
+    auth = Auth()
+    assert auth.username == "someone"
+
+    remover = threading.Thread(target=auth.remove)
+    remover.start()
+    time.sleep(backend.delay / 2)
+    auth.username
+    remover.join()
+
+    assert auth.username is None
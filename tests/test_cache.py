@@ -0,0 +1,49 @@
+# Standard Library
+import os
+import threading
+import time
+
+# First Party
+from apitester.cache import CacheEntry, HTTPCache
+from apitester.config import CacheConf
+
+HEADERS = (("Cache-Control", "max-age=60"),)
+
+
+def test_memory_hits_do_not_wait_for_disk_writes(tmp_path):
+    cache = HTTPCache(CacheConf(path=str(tmp_path / "cache.db")))
+    cache.put(CacheEntry("a", 200, HEADERS, b"body"))
+
+    writing, done = threading.Event(), threading.Event()
+
+    def write() -> None:
+        with cache._lock:
+            writing.set()
+            done.wait(1)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    writing.wait()
+    start = time.perf_counter()
+    assert cache.cached("a") is not None
+    elapsed = time.perf_counter() - start
+    done.set()
+    writer.join()
+
+    assert elapsed < 0.5
+    cache.close()
+
+
+def test_eviction_keeps_what_was_used_from_memory(tmp_path):
+    cache = HTTPCache(CacheConf(path=str(tmp_path / "cache.db"), max_bytes=2500))
+    body = os.urandom(1000)  # Doesn't compress, so two fit and a third doesn't
+
+    cache.put(CacheEntry("a", 200, HEADERS, body))
+    time.sleep(0.01)
+    cache.put(CacheEntry("b", 200, HEADERS, body))
+    time.sleep(0.01)
+    assert cache.cached("a") is not None
+    cache.put(CacheEntry("c", 200, HEADERS, body))
+
+    assert sorted(url for (url,) in cache.connection.execute("SELECT url FROM responses")) == ["a", "c"]
+    cache.close()
@@ -0,0 +1,22 @@
+# Standard Library
+import os
+
+# First Party
+from apitester.config import HistoryConf
+from apitester.history import HistoryStore
+
+
+def record(store: HistoryStore, body: bytes) -> int:
+    return store.record("ping", "GET", "/ping", {}, 200, {}, {"total_ms": 1.0}, body, "application/octet-stream")
+
+
+def test_a_body_bigger_than_the_store_is_not_kept_and_evicts_nothing(tmp_path):
+    store = HistoryStore(HistoryConf(path=str(tmp_path / "history.db"), max_bytes=4096))
+    older = record(store, os.urandom(1000))
+
+    newest = record(store, os.urandom(8192))
+
+    assert [entry.id for entry in store.entries("ping")] == [newest, older]
+    assert store.body(store.entries("ping")[0]) == ("application/octet-stream", None)
+    assert 1000 < store.stored_bytes <= 4096
+    store.close()
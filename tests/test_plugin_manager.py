@@ -0,0 +1,63 @@
+# Third Party
+import pluggy
+
+# First Party
+from apitester import __name__ as project_name
+from apitester.plugin_manager import PluginManager
+from apitester.specs import cache
+
+hookimpl = pluggy.HookimplMarker(project_name)
+
+
+class Token:
+    calls = 0
+
+    @hookimpl
+    @cache()
+    def headers(self):
+        Token.calls += 1
+        return {"authorization": "Bearer abc", "x-source": "token"}
+
+
+class OldStyleWrapper:
+    @hookimpl(hookwrapper=True)
+    @cache()
+    def headers(self):
+        outcome = yield
+        outcome.force_result([*outcome.get_result(), {"x-wrapped": "old", "x-source": "wrapper"}])
+
+
+class Wrapper:
+    @hookimpl(wrapper=True)
+    def headers(self):
+        results = yield
+        return [{"x-wrapped": "new"}, *results]
+
+
+def test_old_style_hookwrapper_results_are_merged_and_cached():
+    plugins = PluginManager()
+    plugins.register(Token())
+    plugins.register(OldStyleWrapper())
+    calls = Token.calls
+
+    for _ in range(3):
+        headers = plugins.get_headers({"accept": "application/json"})
+        assert headers["authorization"] == "Bearer abc"
+        assert headers["x-wrapped"] == "old"
+        # An earlier result wins, as pluggy orders them
+        assert headers["x-source"] == "token"
+        assert headers["accept"] == "application/json"
+
+    assert Token.calls == calls + 1
+
+
+def test_wrappers_without_a_cache_are_called_every_time():
+    plugins = PluginManager()
+    plugins.register(Token())
+    plugins.register(Wrapper())
+    calls = Token.calls
+
+    for _ in range(3):
+        assert plugins.get_headers()["x-wrapped"] == "new"
+
+    assert Token.calls == calls + 3
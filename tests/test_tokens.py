@@ -0,0 +1,57 @@
+# Standard Library
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+
+# First Party
+from apitester.auth import auth
+from apitester.config import BearerAuthConf
+from apitester.tokens import TokenManager
+
+
+class LoginServer:
+    """Stands in for a SessionManager, counting the logins posted to it."""
+
+    def __init__(self) -> None:
+        self.session = self
+        self.logins = 0
+
+    @asynccontextmanager
+    async def post(self, url, data):
+        self.logins += 1
+        await asyncio.sleep(0.01)
+        yield self
+
+    async def json(self, content_type=None):
+        return {"data": {"token": f"fresh-{self.logins}"}}
+
+
+def manager() -> TokenManager:
+    return TokenManager(BearerAuthConf(type="bearer", url="http://localhost/login", headers=[], token_path="data.token"))
+
+
+def test_concurrent_first_callers_share_the_persisted_token(backend):
+    auth.store_token(json.dumps({"value": "persisted", "expires_at": time.time() + 3600}))
+    server, tokens = LoginServer(), manager()
+
+    async def first_calls():
+        return await asyncio.gather(*(tokens.token(server) for _ in range(3)))
+
+    assert asyncio.run(first_calls()) == ["persisted"] * 3
+    assert server.logins == 0
+    assert backend.calls["get_password"] == 1
+
+
+def test_a_login_during_the_restore_is_kept(backend):
+    auth.store_token(json.dumps({"value": "persisted", "expires_at": time.time() + 3600}))
+    server, tokens = LoginServer(), manager()
+
+    async def login_while_restoring():
+        restoring = asyncio.create_task(tokens.token(server))
+        await asyncio.sleep(0)
+        await tokens.login(server, "someone", "secret", remember=False)
+        return await restoring
+
+    assert asyncio.run(login_while_restoring()) == "fresh-1"
+    assert asyncio.run(tokens.token(server)) == "fresh-1"